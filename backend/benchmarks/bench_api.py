@@ -0,0 +1,321 @@
+"""
+API 부하 벤치마크: 합성 데이터를 채운 DB 에 대해 주요 API 를 ASGI 앱으로 직접(httpx, 네트워크 없이) 호출하고
+시나리오별 p50/p95/p99 지연 시간과 초당 요청 수를 측정해 JSON 으로 저장한다.
+
+    python benchmarks/bench_api.py [--db /tmp/surine-bench.db] [--places 100000] [--users 10000]
+                                   [--records 2000000] [--requests 2000] [--concurrency 16]
+                                   [--compare benchmarks/results/이전결과.json]
+
+- 기본은 SQLite 파일(--db)을 쓰고, 이미 데이터가 있으면 다시 채우지 않는다 (처음 한 번만 오래 걸림).
+- --database-url 로 로컬 MySQL 등을 지정할 수 있다 (빈 DB 여야 데이터를 채움).
+- 결과는 benchmarks/results/api-<시각>-<커밋>.json 에 저장되며, --compare 로 이전 결과와의 차이를 출력한다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, time as dtime, timedelta
+
+# --- 프로젝트 경로 및 벤치마크용 설정 ---
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "surine-bench.db"),
+                        help="SQLite 파일 경로 (--database-url 이 없을 때)")
+    parser.add_argument("--database-url", help="벤치마크에 쓸 DB URL (예: mysql+pymysql://...)")
+    parser.add_argument("--places", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--records", type=int, default=2000000)
+    parser.add_argument("--bookmarks-per-user", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="시나리오별 측정 전 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--scenarios", help="실행할 시나리오 (쉼표 구분, 기본은 전체)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/api-<시각>-<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    return parser.parse_args()
+
+
+args = parse_args()
+os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{args.db}"
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("NAVER_SEARCH_API_CLIENT_ID", "bench")
+os.environ.setdefault("NAVER_SEARCH_API_CLIENT_SECRET", "bench")
+# ---------------------------------------
+
+import httpx
+from sqlalchemy import func, insert
+
+from main import app
+from config import settings
+from db.database import SessionLocal, engine
+from dependencies import create_access_token
+from models.db_models import Base, PlaceModel, BookmarkModel, RecordModel, UserModel
+from crud import crud
+from util.geo import encode_geohash
+from util.password import password_hasher
+
+BENCH_PASSWORD = "bench-password"
+# 장소 이름을 만들고 검색어로도 쓰는 단어
+REGIONS = ["강남", "송파", "마포", "노원", "은평", "강서", "관악", "성북", "부산", "대구", "인천", "수원"]
+KINDS = ["수영장", "체육센터", "스포츠센터", "아쿠아센터", "국민체육센터", "실내수영장"]
+INSERT_CHUNK = 10000
+# 로그인 상태로 요청하는 유저 수 (토큰은 미리 발급)
+ACTIVE_USERS = 200
+
+
+def _insert_chunks(conn, table, rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= INSERT_CHUNK:
+            conn.execute(insert(table), chunk)
+            chunk = []
+    if chunk:
+        conn.execute(insert(table), chunk)
+
+
+def seed(rng: random.Random):
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        place_count = db.query(func.count(PlaceModel.id)).scalar()
+    finally:
+        db.close()
+    if place_count:
+        print(f"기존 데이터를 사용합니다 (장소 {place_count}개). 다시 만들려면 --db 파일을 지우세요.")
+        return
+
+    started_at = time.perf_counter()
+    password = password_hasher.context.hash(BENCH_PASSWORD)
+    now = datetime.now()
+
+    with engine.begin() as conn:
+        def places():
+            for i in range(1, args.places + 1):
+                lat, lng = 35.0 + rng.random() * 3.0, 126.5 + rng.random() * 3.0
+                yield {"id": i, "name": f"{rng.choice(REGIONS)} {rng.choice(KINDS)} {i}",
+                       "address": f"{rng.choice(REGIONS)}구 벤치마크로 {i}",
+                       "x_position": str(lng), "y_position": str(lat), "latitude": lat, "longitude": lng,
+                       "geohash": encode_geohash(lat, lng), "image_url": "", "is_deleted": False}
+
+        def users():
+            for i in range(1, args.users + 1):
+                yield {"id": i, "email": f"bench{i}@example.com", "nickname": f"bench{i}", "password": password,
+                       "created_at": now, "updated_at": now}
+
+        def bookmarks():
+            for user_id in range(1, args.users + 1):
+                for place_id in rng.sample(range(1, args.places + 1), min(args.bookmarks_per_user, args.places)):
+                    yield {"user_id": user_id, "place_id": place_id, "created_at": now, "updated_at": now}
+
+        def records():
+            first_day = date.today() - timedelta(days=730)
+            for _ in range(args.records):
+                hour = rng.randint(6, 21)
+                yield {"user_id": rng.randint(1, args.users), "place_id": rng.randint(1, args.places),
+                       "record_date": first_day + timedelta(days=rng.randrange(730)),
+                       "start_time": dtime(hour, 0), "end_time": dtime(hour + 1, 0),
+                       "pool_length": rng.choice((25, 50)), "swim_distance": rng.randint(5, 40) * 100,
+                       "memo": "", "created_at": now, "updated_at": now}
+
+        for name, table, rows in (("place", PlaceModel.__table__, places()),
+                                  ("user", UserModel.__table__, users()),
+                                  ("bookmark", BookmarkModel.__table__, bookmarks()),
+                                  ("record", RecordModel.__table__, records())):
+            _insert_chunks(conn, table, rows)
+            print(f"  {name} 채움 ({time.perf_counter() - started_at:.1f}s)")
+
+    db = SessionLocal()
+    try:
+        crud.rebuild_place_search_index(db)
+        crud.rebuild_record_rollups(db)
+    finally:
+        db.close()
+    print(f"데이터 생성 완료 ({time.perf_counter() - started_at:.1f}s)")
+
+
+# --- 시나리오: (client, rng, headers) -> response ---
+
+async def places_search(client, rng, headers):
+    term = rng.choice(REGIONS + KINDS)
+    return await client.get("/places/", params={"search": term, "size": 20}, headers=headers)
+
+
+async def places_search_anonymous(client, rng, headers):
+    # 비로그인 요청은 응답 캐시를 거친다
+    term = rng.choice(REGIONS + KINDS)
+    return await client.get("/places/", params={"search": term, "size": 20})
+
+
+async def place_detail(client, rng, headers):
+    return await client.get(f"/places/{rng.randint(1, args.places)}", headers=headers)
+
+
+async def bookmarks_page(client, rng, headers):
+    return await client.get("/bookmarks/", params={"size": 20}, headers=headers)
+
+
+async def records_paging(client, rng, headers):
+    # 첫 페이지 후 next_cursor 로 최대 3페이지 더 넘김 (한 번의 측정 = 페이지 묶음)
+    response = await client.get("/records/", params={"size": 20}, headers=headers)
+    for _ in range(3):
+        next_cursor = response.json().get("next_cursor") if response.status_code == 200 else None
+        if not next_cursor:
+            break
+        response = await client.get("/records/", params={"size": 20, "cursor": next_cursor}, headers=headers)
+    return response
+
+
+async def login(client, rng, headers):
+    email = f"bench{rng.randint(1, args.users)}@example.com"
+    return await client.post("/users/login/local", json={"email": email, "password": BENCH_PASSWORD})
+
+
+SCENARIOS = {
+    "places_search": places_search,
+    "places_search_anonymous": places_search_anonymous,
+    "place_detail": place_detail,
+    "bookmarks_page": bookmarks_page,
+    "records_paging": records_paging,
+    "login": login,
+}
+
+
+def percentile(sorted_values, p: float) -> float:
+    # nearest-rank
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, scenario, tokens, total: int, concurrency: int, seed_value: int) -> dict:
+    latencies, errors = [], 0
+    remaining = total
+
+    async def worker(worker_id: int):
+        nonlocal remaining, errors
+        rng = random.Random(seed_value * 1000 + worker_id)
+        while remaining > 0:
+            remaining -= 1
+            headers = {"Authorization": f"Bearer {rng.choice(tokens)}"}
+            started_at = time.perf_counter()
+            response = await scenario(client, rng, headers)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(sum(latencies) / len(latencies), 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+def git_revision():
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                                         text=True, stderr=subprocess.DEVNULL).strip()
+        dirty = bool(subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"],
+                                             cwd=project_root, text=True, stderr=subprocess.DEVNULL).strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def print_comparison(results: dict, previous_path: str):
+    with open(previous_path) as f:
+        previous = json.load(f)["results"]
+    print(f"\n{previous_path} 대비 (p95, rps)")
+    for name, result in results.items():
+        before = previous.get(name)
+        if before is None:
+            continue
+        p95_change = (result["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0
+        rps_change = (result["rps"] - before["rps"]) / before["rps"] * 100 if before["rps"] else 0
+        print(f"  {name:<24} p95 {before['p95_ms']:8.2f} -> {result['p95_ms']:8.2f} ({p95_change:+.1f}%)"
+              f"  rps {before['rps']:8.1f} -> {result['rps']:8.1f} ({rps_change:+.1f}%)")
+
+
+async def run(names):
+    # 로그인 상태 시나리오는 미리 발급한 토큰을 돌려 씀
+    tokens = [create_access_token(data={"sub": str(user_id)}, expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+              for user_id in range(1, min(ACTIVE_USERS, args.users) + 1)]
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{args.requests} requests per scenario, concurrency {args.concurrency}")
+        for index, name in enumerate(names):
+            scenario = SCENARIOS[name]
+            await run_scenario(client, scenario, tokens, args.warmup, args.concurrency, seed_value=-index - 1)
+            result = await run_scenario(client, scenario, tokens, args.requests, args.concurrency, seed_value=index)
+            results[name] = result
+            print(f"  {name:<24} p50 {result['p50_ms']:8.2f}  p95 {result['p95_ms']:8.2f}  "
+                  f"p99 {result['p99_ms']:8.2f} ms  {result['rps']:8.1f} req/s  errors {result['errors']}")
+    return results
+
+
+def main():
+    names = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 시나리오: {', '.join(unknown)} (가능: {', '.join(SCENARIOS)})")
+
+    seed(random.Random(42))
+    results = asyncio.run(run(names))
+
+    commit, dirty = git_revision()
+    report = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": engine.dialect.name,
+            "places": args.places,
+            "users": args.users,
+            "records": args.records,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), "results",
+                                         f"api-{datetime.now():%Y%m%d-%H%M%S}-{commit}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과를 {output} 에 저장했습니다.")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
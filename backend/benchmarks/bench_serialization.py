@@ -0,0 +1,124 @@
+"""
+목록 API 직렬화 벤치마크: 기존 경로(ORM 객체 → Pydantic 검증 → response_model 재검증 → JSON)와
+fast 경로(컬럼 튜플 → dict → orjson)를 페이지 크기 50 으로 비교한다.
+
+    python benchmarks/bench_serialization.py [--iterations 200] [--size 50]
+
+임시 SQLite 파일에 합성 데이터를 만들어 쓰므로 실제 DB 에는 영향이 없다.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, time as dtime, timedelta
+
+# --- 프로젝트 경로 및 벤치마크용 설정 ---
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+_db_path = os.path.join(tempfile.mkdtemp(prefix="surine-bench-"), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("NAVER_SEARCH_API_CLIENT_ID", "bench")
+os.environ.setdefault("NAVER_SEARCH_API_CLIENT_SECRET", "bench")
+# ---------------------------------------
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from db.database import SessionLocal, engine
+from models.db_models import Base, PlaceModel, BookmarkModel, RecordModel, UserModel
+from schemas.models import PlacePagingResponse, BookmarkPagingResponse, RecordPagingResponse
+from crud import crud
+from util.geo import encode_geohash
+
+
+def seed(place_count: int = 2000, bookmark_count: int = 300, record_count: int = 1000) -> int:
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(42)
+    db = SessionLocal()
+    try:
+        user = UserModel(email="bench@example.com", nickname="bench", password="x")
+        db.add(user)
+        db.flush()
+
+        places = []
+        for i in range(1, place_count + 1):
+            lat, lng = 37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4
+            places.append({
+                "id": i, "name": f"벤치마크 수영장 {i}", "address": f"서울특별시 테스트구 테스트로 {i}",
+                "x_position": str(lng), "y_position": str(lat), "latitude": lat, "longitude": lng,
+                "geohash": encode_geohash(lat, lng), "image_url": "",
+            })
+        db.bulk_insert_mappings(PlaceModel, places)
+        db.bulk_insert_mappings(BookmarkModel, [
+            {"user_id": user.id, "place_id": place_id}
+            for place_id in rng.sample(range(1, place_count + 1), bookmark_count)
+        ])
+        db.bulk_insert_mappings(RecordModel, [{
+            "user_id": user.id, "place_id": rng.randint(1, place_count),
+            "record_date": date(2025, 1, 1) + timedelta(days=i % 365),
+            "start_time": dtime(7, 0), "end_time": dtime(8, 0), "pool_length": 25,
+            "swim_distance": rng.randint(5, 40) * 100, "memo": "벤치마크",
+        } for i in range(record_count)])
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def measure(fn, iterations: int) -> float:
+    fn()  # 워밍업
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started_at) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--size", type=int, default=50)
+    args = parser.parse_args()
+
+    user_id = seed()
+    db = SessionLocal()
+
+    cases = [
+        ("places", crud.get_places, PlacePagingResponse, {"search": ""}),
+        ("bookmarks", crud.get_bookmarks, BookmarkPagingResponse, {"search": ""}),
+        ("records", crud.get_records, RecordPagingResponse, {}),
+    ]
+
+    print(f"page size {args.size}, {args.iterations} iterations (ms per request)")
+    for name, get_list, response_model, kwargs in cases:
+        def default_path():
+            total, result, next_cursor = get_list(db, offset=0, limit=args.size, current_user_id=user_id, **kwargs)
+            # FastAPI 가 response_model 로 다시 검증하고 JSON 으로 만드는 과정과 같게
+            payload = {"total": total, "result": result, "next_cursor": next_cursor}
+            validated = response_model.model_validate(payload)
+            return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        def fast_path():
+            total, result, next_cursor = get_list(db, offset=0, limit=args.size, current_user_id=user_id,
+                                                  fast=True, **kwargs)
+            return orjson.dumps({"total": total, "result": result, "next_cursor": next_cursor})
+
+        if orjson.loads(default_path()) != orjson.loads(fast_path()):
+            raise SystemExit(f"{name}: fast 응답이 기존 응답과 다릅니다")
+
+        default_ms = measure(default_path, args.iterations)
+        fast_ms = measure(fast_path, args.iterations)
+        print(f"  {name:<10} default {default_ms:7.2f}  fast {fast_ms:7.2f}  x{default_ms / fast_ms:.1f}")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,14 +12,86 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     database_url: str
+    # 읽기 전용 API 를 보낼 복제본 DB URL (쉼표로 구분, 비어 있으면 모두 database_url 사용)
+    DATABASE_REPLICA_URLS: str = ""
+    # 복제본 선택 방식: round_robin 또는 least_busy (사용 중인 연결이 가장 적은 복제본)
+    DATABASE_REPLICA_SELECTION: str = "round_robin"
+    # 유저가 쓰기를 한 뒤 이 시간(초) 동안은 그 유저의 읽기도 primary 로 보냄 (복제 지연 대비).
+    # 마지막 쓰기 시각은 last_write 쿠키 / X-Last-Write 헤더로 클라이언트가 들고 다닌다 (util/read_your_writes.py)
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 5
 
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    # True 면 유저 id 만 필요한 요청은 DB 조회 없이 검증된 토큰의 sub 를 사용
+    AUTH_TRUST_TOKEN_SUB: bool = True
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL: int = 60
+
+    # 비밀번호 해시 설정 (util/password.py)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     NAVER_SEARCH_API_CLIENT_ID: str
     NAVER_SEARCH_API_CLIENT_SECRET: str
 
+    # 소셜 로그인 프로필 조회 (util/social_client.py)
+    KAKAO_PROFILE_URL: str = "https://kapi.kakao.com/v2/user/me"
+    NAVER_PROFILE_URL: str = "https://openapi.naver.com/v1/nid/me"
+    GOOGLE_PROFILE_URL: str = "https://www.googleapis.com/oauth2/v2/userinfo"
+    SOCIAL_HTTP_TIMEOUT: float = 5.0
+    SOCIAL_HTTP_CONNECT_TIMEOUT: float = 2.0
+    SOCIAL_HTTP_RETRIES: int = 2
+    SOCIAL_HTTP_MAX_CONNECTIONS: int = 50
+    SOCIAL_PROFILE_CACHE_TTL: int = 60
+
+    # 지도 클러스터 설정: 이 줌 레벨 이하에서는 개별 장소 대신 클러스터를 반환
+    PLACE_CLUSTER_MAX_ZOOM: int = 13
+    # 클러스터 격자 = 줌 레벨 타일을 2^N x 2^N 으로 나눈 셀 (2 이면 256px 타일 기준 64px 셀)
+    PLACE_CLUSTER_GRID_SHIFT: int = 2
+    # 인메모리 장소 인덱스가 data_version 의 변경 여부를 확인하는 주기 (초)
+    PLACE_VERSION_CHECK_INTERVAL: int = 30
+    # 비로그인 장소 목록/상세 응답 캐시 (util/response_cache.py)
+    PLACE_RESPONSE_CACHE_SIZE: int = 2000
+    PLACE_RESPONSE_CACHE_TTL: int = 600
+
+    # 유저별 북마크 장소 id 캐시 (util/bookmark_cache.py). REDIS_URL 을 지정하면 프로세스 간에 공유
+    BOOKMARK_CACHE_SIZE: int = 10000
+    BOOKMARK_CACHE_TTL: int = 300
+    BOOKMARK_CACHE_REDIS_URL: str = ""
+    BOOKMARK_CACHE_REDIS_TIMEOUT: float = 0.5
+
+    # DB 커넥션 풀 (db/database.py). 서버 프로세스 수 x 엔진 2개(동기/비동기) x (SIZE + MAX_OVERFLOW) 가
+    # MySQL max_connections 를 넘지 않게 설정. RECYCLE 은 MySQL wait_timeout(기본 8시간)보다 짧게
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_TIMEOUT: float = 30
+    # 서버 시작 시 미리 열어 둘 연결 수 (엔진별, 0 이면 끔)
+    DB_POOL_WARMUP_SIZE: int = 5
+
+    # 응답 압축 (util/compression.py): 이 크기(바이트) 이상인 JSON/MessagePack 응답을 br 또는 gzip 으로 압축
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # 느린 쿼리 기록 (util/slow_query.py): 이 시간(ms) 이상 걸린 SQL 을 기록 (0 이면 끔)
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    # 느린 SELECT 중 EXPLAIN 결과까지 저장할 비율 (0 ~ 1)
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    SLOW_QUERY_LOG_SIZE: int = 100
+    # /admin API 의 X-Admin-Key 헤더 값 (비어 있으면 /admin API 를 사용할 수 없음)
+    ADMIN_API_KEY: str = ""
+
+    # 변경분 동기화(/sync) 워터마크를 DB 현재 시각보다 이만큼(초) 앞당겨, 늦게 커밋된 변경도 다음 동기화에 포함
+    SYNC_WATERMARK_LAG: int = 5
+    # /sync 한 번에 보내는 종류별(기록/북마크/삭제) 최대 건수. 남은 게 있으면 has_more 로 이어서 요청
+    SYNC_PAGE_SIZE: int = 500
+    # 삭제 기록(sync_tombstone) 보관 기간(일). 이보다 오래된 워터마크로 요청하면 전체 재동기화 (full_resync)
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+
     class Config:
         env_file = ".env"
 
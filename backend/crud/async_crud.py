@@ -0,0 +1,91 @@
+"""
+crud.py 함수들의 비동기 버전.
+AsyncSession.run_sync 로 같은 쿼리 코드를 비동기 드라이버(aiomysql, aiosqlite) 위에서 실행하므로
+DB 응답을 기다리는 동안 이벤트 루프가 막히지 않는다. 첫 번째 인자로 AsyncSession 을 받는 것 외에는
+crud.py 의 같은 이름 함수와 인자/반환값이 같다.
+북마크 집합 캐시(util/bookmark_cache.py)는 비동기 I/O 라서 run_sync 안이 아니라 여기서 읽고 지운다.
+"""
+import functools
+from typing import FrozenSet, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud import crud
+from util.bookmark_cache import bookmark_cache
+
+
+def _run_sync(fn):
+    @functools.wraps(fn)
+    async def wrapper(db: AsyncSession, *args, **kwargs):
+        return await db.run_sync(fn, *args, **kwargs)
+
+    return wrapper
+
+
+async def get_bookmarked_place_ids(db: AsyncSession, current_user_id: Optional[int]) -> FrozenSet[int]:
+    """
+    유저가 북마크한 장소 id 집합. 캐시(Redis 일 수 있음)는 run_sync 밖의 이벤트 루프에서 await 하고,
+    미스일 때만 DB 에서 읽어 캐시한다 (읽는 사이에 북마크가 바뀌었으면 캐시하지 않음).
+    """
+    if not current_user_id:
+        return frozenset()
+
+    place_ids, version = await bookmark_cache.get(current_user_id)
+    if place_ids is None:
+        place_ids = frozenset(await db.run_sync(crud.get_bookmark_place_ids, current_user_id))
+        await bookmark_cache.set(current_user_id, place_ids, version)
+
+    return place_ids
+
+
+def _with_bookmarks(fn):
+    # is_bookmark 를 채우는 장소 조회: 북마크 집합을 먼저 구해 bookmarked 로 넘긴다
+    @functools.wraps(fn)
+    async def wrapper(db: AsyncSession, *args, current_user_id: Optional[int] = None, **kwargs):
+        bookmarked = await get_bookmarked_place_ids(db, current_user_id)
+        return await db.run_sync(fn, *args, current_user_id=current_user_id, bookmarked=bookmarked, **kwargs)
+
+    return wrapper
+
+
+def _invalidating_bookmarks(fn):
+    # 북마크 변경: 커밋이 끝난 뒤 유저의 북마크 집합 캐시를 지운다
+    @functools.wraps(fn)
+    async def wrapper(db: AsyncSession, *, user_id: int, **kwargs):
+        try:
+            return await db.run_sync(fn, user_id=user_id, **kwargs)
+        finally:
+            await bookmark_cache.invalidate(user_id)
+
+    return wrapper
+
+
+get_records = _run_sync(crud.get_records)
+create_record = _run_sync(crud.create_record)
+create_records_batch = _run_sync(crud.create_records_batch)
+get_record_detail = _run_sync(crud.get_record_detail)
+get_record_stats = _run_sync(crud.get_record_stats)
+get_record_calendar = _run_sync(crud.get_record_calendar)
+
+get_places = _with_bookmarks(crud.get_places)
+get_place_detail = _with_bookmarks(crud.get_place_detail)
+get_nearby_places = _with_bookmarks(crud.get_nearby_places)
+get_viewport_places = _with_bookmarks(crud.get_viewport_places)
+get_viewport_clusters = _run_sync(crud.get_viewport_clusters)
+get_data_version = _run_sync(crud.get_data_version)
+
+get_bookmarks = _run_sync(crud.get_bookmarks)
+create_bookmark = _invalidating_bookmarks(crud.create_bookmark)
+delete_bookmark = _invalidating_bookmarks(crud.delete_bookmark)
+update_bookmarks_batch = _invalidating_bookmarks(crud.update_bookmarks_batch)
+get_bookmark_place_ids = _run_sync(crud.get_bookmark_place_ids)
+
+get_sync_changes = _run_sync(crud.get_sync_changes)
+prune_sync_tombstones = _run_sync(crud.prune_sync_tombstones)
+
+get_user_by_email = _run_sync(crud.get_user_by_email)
+create_user = _run_sync(crud.create_user)
+get_user_by_id = _run_sync(crud.get_user_by_id)
+exist_nickname = _run_sync(crud.exist_nickname)
+get_social_user = _run_sync(crud.get_social_user)
+create_social_user = _run_sync(crud.create_social_user)
@@ -1,31 +1,88 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from sqlalchemy.sql.expression import case, literal, and_
-from typing import List, Optional, Tuple
-from models.db_models import PlaceModel, BookmarkModel, UserModel, RecordModel
-from schemas.models import Place, Bookmark, UserCreate, User, Record
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from sqlalchemy import func, tuple_, select, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql.expression import case, literal, and_, or_
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from datetime import date, time, datetime, timedelta
+from config import settings
+from models.db_models import PlaceModel, PlaceClusterModel, PlaceSearchGramModel, BookmarkModel, UserModel, RecordModel, \
+    DataVersionModel, PlaceSyncRunModel, RecordRollupModel, SyncTombstoneModel
+from schemas.models import Place, NearbyPlace, Bookmark, UserCreate, User, Record
+from util.cursor import encode_cursor, decode_cursor
+from util.search import normalize_text, ngrams, escape_like, LIKE_ESCAPE
+from util.suggest import PlaceSuggestIndex
+from util.period import PERIODS, period_start, duration_seconds
+from util.geo import precision_for_radius, encode_geohash, geohash_neighbors, haversine, lat_lng_to_tile
 
 def get_records(db: Session,
                 offset: int,
                 limit: int,
-                current_user_id: int) -> Tuple[int, List[Record]]:
+                current_user_id: int,
+                cursor: Optional[str] = None,
+                include_total: bool = True,
+                fast: bool = False) -> Tuple[Optional[int], List[Record], Optional[str]]:
+    """fast 면 필요한 컬럼만 튜플로 조회해 Record 스키마와 같은 모양의 dict 목록을 반환 (Pydantic 검증 생략)"""
 
     query = db.query(RecordModel)
     query = query.filter(RecordModel.user_id == current_user_id)
 
-    total_count = query.count()
+    total_count = query.count() if include_total else None
+
+    # 커서가 있으면 (record_date, start_time, id) 내림차순 기준으로 이어서 조회
+    if cursor:
+        record_date, start_time, record_id = decode_cursor(cursor, 3)
+        try:
+            key = (date.fromisoformat(record_date), time.fromisoformat(start_time), int(record_id))
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        query = query.filter(
+            tuple_(RecordModel.record_date, RecordModel.start_time, RecordModel.id) < key
+        )
+        offset = 0
+
+    if fast:
+        query = query.join(PlaceModel, RecordModel.place_id == PlaceModel.id).with_entities(
+            RecordModel.id.label("record_id"), RecordModel.user_id, RecordModel.place_id, RecordModel.record_date,
+            RecordModel.start_time, RecordModel.end_time, RecordModel.pool_length, RecordModel.swim_distance,
+            RecordModel.memo, RecordModel.created_at, RecordModel.updated_at, *PLACE_FAST_COLUMNS)
+    else:
+        query = query.options(joinedload(RecordModel.place))
 
-    result = (query.options(joinedload(RecordModel.place))
+    # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+    result = (query
                 .order_by(RecordModel.record_date.desc())
                 .order_by(RecordModel.start_time.desc())
+                .order_by(RecordModel.id.desc())
                 .offset(offset)
-                .limit(limit)
+                .limit(limit + 1)
                 .all())
 
-    return total_count, result
+    next_cursor = None
+    if len(result) > limit:
+        result = result[:limit]
+        last = result[-1]
+        next_cursor = encode_cursor([last.record_date.isoformat(), last.start_time.isoformat(),
+                                     last.record_id if fast else last.id])
+
+    if fast:
+        result = [{
+            "id": row.record_id,
+            "user_id": row.user_id,
+            "place_id": row.place_id,
+            "record_date": row.record_date,
+            "start_time": row.start_time,
+            "end_time": row.end_time,
+            "pool_length": row.pool_length,
+            "swim_distance": row.swim_distance,
+            "memo": row.memo,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "place": _place_row_dict(row),
+        } for row in result]
+
+    return total_count, result, next_cursor
 
 
 def create_record(db, data, current_user_id):
@@ -41,123 +98,745 @@ def create_record(db, data, current_user_id):
     )
 
     db.add(record)
+    # 통계 합계도 같은 트랜잭션에서 증분 갱신
+    add_record_rollups(db, _record_rollup_rows([
+        (current_user_id, data.place_id, data.record_date, data.start_time, data.end_time, data.swim_distance)
+    ]))
     db.commit()
     db.refresh(record)
 
     return record
+
+def create_records_batch(db: Session, items: list, current_user_id: int) -> List[dict]:
+    """
+    여러 기록을 한 트랜잭션, 한 번의 다중 행 INSERT 로 저장한다.
+    client_id 가 이미 저장된 기록은 다시 만들지 않고 기존 id 를 돌려주므로 재시도해도 중복이 생기지 않는다.
+    항목 순서대로 {client_id, status('created' | 'duplicate' | 'invalid'), record_id} 를 반환.
+    """
+    client_ids = list({item.client_id: None for item in items})
+    place_ids = {item.place_id for item in items}
+
+    for attempt in range(2):
+        existing = dict(db.query(RecordModel.client_id, RecordModel.id)
+                        .filter(RecordModel.user_id == current_user_id, RecordModel.client_id.in_(client_ids))
+                        .all())
+        valid_place_ids = {place_id for place_id, in db.query(PlaceModel.id).filter(PlaceModel.id.in_(place_ids))}
+
+        # 요청 안에서 같은 client_id 가 반복되면 첫 항목만 저장
+        rows, statuses = {}, []
+        for item in items:
+            if item.client_id in existing or item.client_id in rows:
+                statuses.append("duplicate")
+            elif item.place_id not in valid_place_ids:
+                statuses.append("invalid")  # 없는 장소
+            else:
+                statuses.append("created")
+                rows[item.client_id] = {
+                    "user_id": current_user_id,
+                    "client_id": item.client_id,
+                    "place_id": item.place_id,
+                    "record_date": item.record_date,
+                    "start_time": item.start_time,
+                    "end_time": item.end_time,
+                    "pool_length": item.pool_length,
+                    "swim_distance": item.swim_distance,
+                    "memo": item.memo,
+                }
+
+        if not rows:
+            break
+
+        try:
+            db.execute(insert(RecordModel).values(list(rows.values())))
+            add_record_rollups(db, _record_rollup_rows([
+                (current_user_id, row["place_id"], row["record_date"], row["start_time"], row["end_time"],
+                 row["swim_distance"])
+                for row in rows.values()
+            ]))
+            db.commit()
+            break
+        except IntegrityError:
+            # 같은 묶음이 동시에 올라온 경우: 먼저 저장된 기록을 다시 읽어 중복으로 처리
+            db.rollback()
+            if attempt:
+                raise
+
+    if rows:
+        existing.update(db.query(RecordModel.client_id, RecordModel.id)
+                        .filter(RecordModel.user_id == current_user_id, RecordModel.client_id.in_(list(rows)))
+                        .all())
+
+    return [
+        {"client_id": item.client_id, "status": status,
+         "record_id": existing.get(item.client_id) if status != "invalid" else None}
+        for item, status in zip(items, statuses)
+    ]
+
+def _record_rollup_rows(records) -> List[dict]:
+    # (user_id, place_id, record_date, start_time, end_time, swim_distance) 목록을 집계 구간/장소별 증가분으로 합친다
+    totals = {}
+    for user_id, place_id, record_date, start_time, end_time, swim_distance in records:
+        seconds = duration_seconds(start_time, end_time)
+        for period in PERIODS:
+            key = (user_id, period, period_start(record_date, period), place_id)
+            row = totals.get(key)
+            if row is None:
+                row = totals[key] = {
+                    "user_id": user_id,
+                    "period": period,
+                    "period_start": key[2],
+                    "place_id": place_id,
+                    "distance": 0,
+                    "duration_seconds": 0,
+                    "session_count": 0,
+                }
+            row["distance"] += swim_distance
+            row["duration_seconds"] += seconds
+            row["session_count"] += 1
+
+    return list(totals.values())
+
+def add_record_rollups(db: Session, rows: List[dict]):
+    """record_rollup 에 증가분을 더한다 (없는 구간은 새로 만듦). 커밋은 호출하는 쪽에서."""
+    if not rows:
+        return
+
+    add_columns = ("distance", "duration_seconds", "session_count")
+    table = RecordRollupModel.__table__
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql_insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update({column: table.c[column] + stmt.inserted[column] for column in add_columns})
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "period", "period_start", "place_id"],
+            set_={column: table.c[column] + stmt.excluded[column] for column in add_columns}
+        )
+    else:
+        raise NotImplementedError(f"upsert is not supported for {dialect}")
+
+    db.execute(stmt)
+
+def rebuild_record_rollups(db: Session, batch_size: int = 1000) -> int:
+    """모든 기록으로 record_rollup 을 다시 만든다. 저장한 행 수를 반환."""
+    records = (db.query(RecordModel.user_id, RecordModel.place_id, RecordModel.record_date,
+                        RecordModel.start_time, RecordModel.end_time, RecordModel.swim_distance)
+               .yield_per(batch_size))
+    rows = _record_rollup_rows(records)
+
+    db.query(RecordRollupModel).delete()
+    for i in range(0, len(rows), batch_size):
+        db.bulk_insert_mappings(RecordRollupModel, rows[i:i + batch_size])
+    db.commit()
+
+    return len(rows)
+
+def get_record_stats(db: Session, current_user_id: int, period: str, limit: int) -> List[dict]:
+    """최근 limit 개 집계 구간의 합계와 장소별 합계 (최근 구간부터)"""
+    starts = [start for start, in (db.query(RecordRollupModel.period_start)
+                                   .filter(RecordRollupModel.user_id == current_user_id,
+                                           RecordRollupModel.period == period)
+                                   .distinct()
+                                   .order_by(RecordRollupModel.period_start.desc())
+                                   .limit(limit)
+                                   .all())]
+    if not starts:
+        return []
+
+    rows = (db.query(RecordRollupModel, PlaceModel.name)
+            .join(PlaceModel, RecordRollupModel.place_id == PlaceModel.id)
+            .filter(RecordRollupModel.user_id == current_user_id,
+                    RecordRollupModel.period == period,
+                    RecordRollupModel.period_start.in_(starts))
+            .order_by(RecordRollupModel.period_start.desc(), RecordRollupModel.distance.desc())
+            .all())
+
+    result = {}
+    for rollup, place_name in rows:
+        stats = result.get(rollup.period_start)
+        if stats is None:
+            stats = result[rollup.period_start] = {
+                "period_start": rollup.period_start,
+                "distance": 0,
+                "duration_seconds": 0,
+                "session_count": 0,
+                "pools": [],
+            }
+        stats["distance"] += rollup.distance
+        stats["duration_seconds"] += rollup.duration_seconds
+        stats["session_count"] += rollup.session_count
+        stats["pools"].append({
+            "place_id": rollup.place_id,
+            "place_name": place_name,
+            "distance": rollup.distance,
+            "duration_seconds": rollup.duration_seconds,
+            "session_count": rollup.session_count,
+        })
+
+    # 평균 페이스: 100m 당 초
+    for stats in result.values():
+        distance = stats["distance"]
+        stats["pace_seconds_per_100m"] = round(stats["duration_seconds"] * 100 / distance, 1) if distance else None
+
+    return list(result.values())
+
+def get_record_calendar(db: Session, current_user_id: int, from_date: date, to_date: date) -> dict:
+    """
+    기간 안의 날짜별 거리 합계, 횟수, 이용한 장소 id 를 열(column) 단위 배열로 반환.
+    ix_record_user_date_time 의 (user_id, record_date) 접두사로 범위 조회한다.
+    """
+    rows = (db.query(RecordModel.record_date,
+                     RecordModel.place_id,
+                     func.sum(RecordModel.swim_distance),
+                     func.count(RecordModel.id))
+            .filter(RecordModel.user_id == current_user_id,
+                    RecordModel.record_date.between(from_date, to_date))
+            .group_by(RecordModel.record_date, RecordModel.place_id)
+            .order_by(RecordModel.record_date, RecordModel.place_id)
+            .all())
+
+    calendar = {"dates": [], "distance": [], "session_count": [], "place_ids": []}
+    for record_date, place_id, distance, count in rows:
+        if not calendar["dates"] or calendar["dates"][-1] != record_date:
+            calendar["dates"].append(record_date)
+            calendar["distance"].append(0)
+            calendar["session_count"].append(0)
+            calendar["place_ids"].append([])
+        calendar["distance"][-1] += int(distance or 0)
+        calendar["session_count"][-1] += count
+        calendar["place_ids"][-1].append(place_id)
+
+    return calendar
+
 def get_record_detail(db, record_id, current_user_id):
     return None
+def _place_search_filter(search: str):
+    """
+    장소 이름/주소 검색 조건과 관련도 점수 식을 반환 (검색어가 비어 있으면 None).
+    n-gram 역색인(place_search_gram)으로 후보 장소를 먼저 좁히고,
+    후보에 대해서만 공백을 제거한 부분 문자열 비교로 정확히 걸러낸다.
+    """
+    norm = normalize_text(search)
+    if not norm:
+        return None
+
+    pattern = f"%{escape_like(norm)}%"
+    name_text = func.replace(func.lower(PlaceModel.name), ' ', '')
+    address_text = func.replace(func.lower(PlaceModel.address), ' ', '')
+    name_match = name_text.like(pattern, escape=LIKE_ESCAPE)
+    address_match = address_text.like(pattern, escape=LIKE_ESCAPE)
+
+    clause = or_(name_match, address_match)
+
+    grams = ngrams(norm)
+    if grams:
+        # 한 필드(이름 또는 주소)에 검색어의 모든 n-gram 이 들어 있는 장소만 후보
+        candidates = (select(PlaceSearchGramModel.place_id)
+                      .where(PlaceSearchGramModel.gram.in_(grams))
+                      .group_by(PlaceSearchGramModel.place_id, PlaceSearchGramModel.field)
+                      .having(func.count(PlaceSearchGramModel.gram) == len(grams)))
+        clause = and_(PlaceModel.id.in_(candidates), clause)
+    # n-gram 보다 짧은 검색어(한 글자)는 역색인을 쓸 수 없어 LIKE 로만 찾는다
+
+    # 관련도: 이름 접두사 일치 > 이름 포함 > 주소 포함
+    score = case(
+        (name_text.like(f"{escape_like(norm)}%", escape=LIKE_ESCAPE), 4),
+        (name_match, 2),
+        else_=0
+    ) + case((address_match, 1), else_=0)
+
+    return clause, score
+
+def upsert_places(db: Session, rows: List[dict]) -> int:
+    """
+    (name, address) 유니크 키 기준으로 장소를 한 번의 다중 행 INSERT 로 넣고,
+    이미 있으면 좌표만 갱신한다. MySQL 은 ON DUPLICATE KEY UPDATE, SQLite 는 ON CONFLICT 를 사용.
+    숨김 여부(is_deleted, deleted_at)는 동기화(sync_place.py)가 관리하므로 이미 있는 장소에서는 바꾸지 않는다.
+    """
+    if not rows:
+        return 0
+
+    update_columns = ("x_position", "y_position", "latitude", "longitude", "geohash")
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql_insert(PlaceModel).values(rows)
+        stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(PlaceModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name", "address"],
+            set_={column: stmt.excluded[column] for column in update_columns}
+        )
+    else:
+        raise NotImplementedError(f"upsert is not supported for {dialect}")
+
+    db.execute(stmt)
+    return len(rows)
+
+def rebuild_place_search_index(db: Session, batch_size: int = 1000) -> int:
+    """
+    모든 장소의 이름/주소로 place_search_gram 역색인을 다시 만든다. 저장한 n-gram 수를 반환.
+    장소를 id 순으로 batch_size 개씩 읽어 그 n-gram 만 넣으므로 전체 n-gram 을 메모리에 올리지 않는다.
+    """
+    db.query(PlaceSearchGramModel).delete()
+
+    count = 0
+    last_id = 0
+    while True:
+        places = (db.query(PlaceModel.id, PlaceModel.name, PlaceModel.address)
+                  .filter(PlaceModel.is_deleted.is_(False), PlaceModel.id > last_id)
+                  .order_by(PlaceModel.id)
+                  .limit(batch_size)
+                  .all())
+        if not places:
+            break
+
+        rows = []
+        for place_id, name, address in places:
+            for field, text in (('name', name), ('address', address)):
+                for gram in ngrams(normalize_text(text)):
+                    rows.append({"gram": gram, "field": field, "place_id": place_id})
+        for i in range(0, len(rows), batch_size):
+            db.bulk_insert_mappings(PlaceSearchGramModel, rows[i:i + batch_size])
+
+        count += len(rows)
+        last_id = places[-1].id
+    db.commit()
+
+    return count
+
+def get_place_sync_run(db: Session, source: str) -> PlaceSyncRunModel:
+    """원천의 중단된(running) 동기화 실행이 있으면 이어서 쓰고, 없으면 새로 시작한다."""
+    run = (db.query(PlaceSyncRunModel)
+           .filter(PlaceSyncRunModel.source == source, PlaceSyncRunModel.status == 'running')
+           .order_by(PlaceSyncRunModel.id.desc())
+           .first())
+    if run is None:
+        run = PlaceSyncRunModel(source=source, status='running', position=0,
+                                inserted=0, updated=0, deleted=0, unchanged=0)
+        db.add(run)
+        db.commit()
+        db.refresh(run)
+
+    return run
+
+def get_place_sync_state(db: Session, source: str, source_ids: List[str]) -> Dict[str, Tuple[int, Optional[str], bool]]:
+    """source_id 별 (place id, fingerprint, is_deleted)"""
+    if not source_ids:
+        return {}
+
+    rows = (db.query(PlaceModel.source_id, PlaceModel.id, PlaceModel.fingerprint, PlaceModel.is_deleted)
+            .filter(PlaceModel.source == source, PlaceModel.source_id.in_(source_ids))
+            .all())
+    return {source_id: (place_id, fingerprint, is_deleted) for source_id, place_id, fingerprint, is_deleted in rows}
+
+def get_place_owners(db: Session, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[int, Optional[str], Optional[str]]]:
+    """(name, address) 별 이미 저장된 장소의 (place id, source, source_id)"""
+    if not keys:
+        return {}
+
+    rows = (db.query(PlaceModel.name, PlaceModel.address, PlaceModel.id, PlaceModel.source, PlaceModel.source_id)
+            .filter(tuple_(PlaceModel.name, PlaceModel.address).in_(keys))
+            .all())
+    return {(name, address): (place_id, source, source_id) for name, address, place_id, source, source_id in rows}
+
+def apply_place_sync_batch(db: Session,
+                           run: PlaceSyncRunModel,
+                           inserts: List[dict],
+                           updates: List[dict],
+                           seen_source_ids: List[str],
+                           position: int):
+    """
+    한 묶음의 변경분(새 장소, 바뀐/숨길 장소)을 반영하고, 묶음의 모든 source_id 를 이번 실행에서 확인했다고 표시한 뒤
+    체크포인트(position)와 함께 한 트랜잭션으로 커밋한다.
+    """
+    if inserts:
+        db.bulk_insert_mappings(PlaceModel, inserts)
+    if updates:
+        db.bulk_update_mappings(PlaceModel, updates)
+
+    if seen_source_ids:
+        (db.query(PlaceModel)
+         .filter(PlaceModel.source == run.source, PlaceModel.source_id.in_(seen_source_ids))
+         .update({PlaceModel.sync_run_id: run.id}, synchronize_session=False))
+
+    run.position = position
+    db.commit()
+
+def finish_place_sync_run(db: Session, run: PlaceSyncRunModel) -> int:
+    """이번 실행에서 원천에 보이지 않은 장소를 숨기고 실행을 끝낸다. 숨긴 장소 수를 반환."""
+    deleted = (db.query(PlaceModel)
+               .filter(PlaceModel.source == run.source,
+                       PlaceModel.is_deleted.is_(False),
+                       or_(PlaceModel.sync_run_id.is_(None), PlaceModel.sync_run_id != run.id))
+               .update({PlaceModel.is_deleted: True, PlaceModel.deleted_at: datetime.now()},
+                       synchronize_session=False))
+
+    run.deleted += deleted
+    run.status = 'done'
+    run.finished_at = datetime.now()
+    db.commit()
+
+    return deleted
+
 def get_places(db: Session,
                offset: int,
                limit: int,
                search: Optional[str] = None,
-               current_user_id: Optional[int] = None) -> Tuple[int, List[Place]]: # 반환 타입도 수정
+               current_user_id: Optional[int] = None,
+               cursor: Optional[str] = None,
+               include_total: bool = True,
+               fast: bool = False,
+               bookmarked: Optional[FrozenSet[int]] = None) -> Tuple[Optional[int], List[Place], Optional[str]]: # 반환 타입도 수정
+    """fast 면 필요한 컬럼만 튜플로 조회해 Place 스키마와 같은 모양의 dict 목록을 반환 (Pydantic 검증 생략)"""
+
+    search_filter = _place_search_filter(search)
 
-    # 1. total_count를 위한 쿼리 빌드
-    count_query = db.query(func.count(PlaceModel.id))
+    # 1. total_count를 위한 쿼리 빌드 (include_total 이 False 면 생략)
+    total_count = None
+    if include_total:
+        count_query = db.query(func.count(PlaceModel.id)).filter(PlaceModel.is_deleted.is_(False))
 
-    trim_search = search.strip()
-    if trim_search:
-        count_query = count_query.filter(PlaceModel.name.like(f"%{trim_search}%"))
+        if search_filter is not None:
+            count_query = count_query.filter(search_filter[0])
 
-    total_count = count_query.scalar()
+        total_count = count_query.scalar()
 
     # 2. place 데이터를 가져오기 위한 메인 쿼리 빌드
-    # 메인 쿼리는 항상 PlaceModel을 기본으로 시작합니다.
-    main_query = db.query(PlaceModel)
-
-    if search:
-        trim_search = search.strip()
-        if trim_search:
-            main_query = main_query.filter(PlaceModel.name.like(f"%{trim_search}%"))
-
-    # 3. 로그인 상태에 따라 is_bookmarked 필드를 추가
-    is_bookmarked_case = case(
-        (BookmarkModel.id.isnot(None), True),
-        else_=False
-    ).label("is_bookmark")
-
-    if current_user_id:
-        main_query = main_query.add_columns(is_bookmarked_case).outerjoin(
-            BookmarkModel,
-            and_(
-                BookmarkModel.place_id == PlaceModel.id,
-                BookmarkModel.user_id == current_user_id
-            )
-        )
+    # 검색어가 있으면 관련도 순, 없으면 id 순으로 정렬합니다.
+    entities = PLACE_FAST_COLUMNS if fast else (PlaceModel,)
+    if search_filter is not None:
+        search_clause, score = search_filter
+        main_query = db.query(*entities, score.label("score")).filter(search_clause)
     else:
-        main_query = main_query.add_columns(literal(False).label("is_bookmark"))
+        score = None
+        main_query = db.query(*entities, literal(0).label("score"))
+    main_query = main_query.filter(PlaceModel.is_deleted.is_(False))
+
+    # 커서가 있으면 마지막으로 받은 (점수, id) 다음부터 조회
+    if cursor:
+        if score is not None:
+            last_score, place_id = decode_cursor(cursor, 2)
+            if not isinstance(last_score, int) or not isinstance(place_id, int):
+                raise ValueError("Invalid cursor")
+            main_query = main_query.filter(or_(
+                score < last_score,
+                and_(score == last_score, PlaceModel.id > place_id)
+            ))
+        else:
+            place_id, = decode_cursor(cursor, 1)
+            if not isinstance(place_id, int):
+                raise ValueError("Invalid cursor")
+            main_query = main_query.filter(PlaceModel.id > place_id)
+        offset = 0
 
-    # 4. 페이징 적용
-    places_data = main_query.offset(offset).limit(limit).all()
+    # 3. 페이징 적용 (다음 페이지 존재 여부를 알기 위해 한 건 더 조회)
+    if score is not None:
+        main_query = main_query.order_by(score.desc())
+    places_data = (main_query.order_by(PlaceModel.id)
+                   .offset(offset)
+                   .limit(limit + 1)
+                   .all())
+
+    next_cursor = None
+    if len(places_data) > limit:
+        places_data = places_data[:limit]
+        last = places_data[-1]
+        last_id = last.id if fast else last[0].id
+        next_cursor = encode_cursor([last.score, last_id] if score is not None else [last_id])
+
+    # 4. 결과 변환 (북마크 여부는 유저별 북마크 id 집합으로 채움)
+    bookmarked = _bookmarked_place_ids(db, current_user_id, bookmarked)
+    if fast:
+        return total_count, [_place_row_dict(row, bookmarked) for row in places_data], next_cursor
 
-    # 5. 결과 변환 (튜플 형태로 반환되므로 그대로 사용)
     result = []
-    for place_model, is_bookmark in places_data:
+    for place_model, _ in places_data:
         place_data = Place.model_validate(place_model)
-        place_data.is_bookmark = is_bookmark
+        place_data.is_bookmark = place_model.id in bookmarked
         result.append(place_data)
 
-    return total_count, result
+    return total_count, result, next_cursor
+
+# fast 응답에서 조회하는 장소 컬럼 (schemas.models.Place 의 필드)
+PLACE_FAST_COLUMNS = (PlaceModel.id, PlaceModel.name, PlaceModel.address, PlaceModel.image_url,
+                      PlaceModel.x_position, PlaceModel.y_position)
+
+def _place_row_dict(row, bookmarked: FrozenSet[int] = frozenset()) -> dict:
+    # PLACE_FAST_COLUMNS 를 포함한 조회 결과 행을 Place 와 같은 JSON 모양의 dict 로 변환
+    return {
+        "id": row.id,
+        "name": row.name,
+        "address": row.address,
+        "image_url": row.image_url,
+        "x_position": row.x_position,
+        "y_position": row.y_position,
+        "is_bookmark": row.id in bookmarked,
+    }
 
 def get_place_detail(db: Session,
                      place_id: int,
-                     current_user_id: Optional[int]) -> Optional[Place]:
-
-    # 1. is_bookmarked 필드를 위한 case 문 생성
-    is_bookmarked_case = case(
-        (BookmarkModel.id.isnot(None), True),
-        else_=False
-    ).label("is_bookmarked")
-
-    # 2. 메인 쿼리 구성
-    if current_user_id:
-        # 로그인 유저가 있는 경우: outerjoin으로 북마크 여부 확인
-        query = db.query(PlaceModel, is_bookmarked_case).outerjoin(
-            BookmarkModel,
-            and_(
-                BookmarkModel.place_id == PlaceModel.id,
-                BookmarkModel.user_id == current_user_id
-            )
-        )
-    else:
-        # 로그인 유저가 없는 경우: join 없이 is_bookmarked를 항상 False로 고정
-        query = db.query(PlaceModel, literal(False).label("is_bookmarked"))
+                     current_user_id: Optional[int],
+                     bookmarked: Optional[FrozenSet[int]] = None) -> Optional[Place]:
 
-    # 3. place_id로 필터링하고 첫 번째 결과 가져오기
-    place_data = query.filter(PlaceModel.id == place_id).first()
-    place_model, is_bookmark= place_data
+    place_model = db.query(PlaceModel).filter(PlaceModel.id == place_id).first()
+    if place_model is None:
+        return None
 
-    # 5. Pydantic 모델로 변환
     result = Place.model_validate(place_model)
-    result.is_bookmark = is_bookmark
+    result.is_bookmark = place_model.id in _bookmarked_place_ids(db, current_user_id, bookmarked)
+
+    return result
+
+def _bookmarked_place_ids(db: Session,
+                          current_user_id: Optional[int],
+                          bookmarked: Optional[FrozenSet[int]] = None) -> FrozenSet[int]:
+    # 로그인 유저가 북마크한 장소 id 집합. 비동기 라우터는 캐시(async_crud.get_bookmarked_place_ids)에서
+    # 미리 읽어 bookmarked 로 넘기고, 넘기지 않으면 DB 에서 읽는다
+    if bookmarked is not None:
+        return bookmarked
+    if not current_user_id:
+        return frozenset()
+
+    return frozenset(get_bookmark_place_ids(db, current_user_id))
+
+def get_nearby_places(db: Session,
+                      lat: float,
+                      lng: float,
+                      radius: float,
+                      limit: int,
+                      current_user_id: Optional[int] = None,
+                      bookmarked: Optional[FrozenSet[int]] = None) -> List[NearbyPlace]:
+
+    # 1. 반경을 덮는 geohash 셀(중심 + 주변 8칸) 계산
+    query = db.query(PlaceModel).filter(PlaceModel.is_deleted.is_(False))
+
+    precision = precision_for_radius(radius, lat)
+    if precision:
+        cells = geohash_neighbors(encode_geohash(lat, lng, precision))
+        # geohash 접두사 검색을 인덱스 범위 검색으로 변환 ('{' 는 base32 알파벳의 마지막 문자 'z' 다음 문자)
+        query = query.filter(or_(*[
+            and_(PlaceModel.geohash >= cell, PlaceModel.geohash < cell + "{")
+            for cell in cells
+        ]))
+    else:
+        query = query.filter(PlaceModel.geohash.isnot(None))
+
+    # 2. 후보 셀 안의 장소만 실제 거리 계산 후 반경 필터 및 정렬
+    candidates = []
+    for place_model in query.all():
+        distance = haversine(lat, lng, place_model.latitude, place_model.longitude)
+        if distance <= radius:
+            candidates.append((distance, place_model))
+
+    candidates.sort(key=lambda item: item[0])
+
+    # 3. 로그인 상태면 북마크 여부 표시
+    bookmarked = _bookmarked_place_ids(db, current_user_id, bookmarked)
+    result = []
+    for distance, place_model in candidates[:limit]:
+        place_data = NearbyPlace(**Place.model_validate(place_model).model_dump(), distance=round(distance, 1))
+        place_data.is_bookmark = place_model.id in bookmarked
+        result.append(place_data)
+
+    return result
+
+def get_viewport_places(db: Session,
+                        min_lat: float,
+                        min_lng: float,
+                        max_lat: float,
+                        max_lng: float,
+                        limit: int,
+                        current_user_id: Optional[int] = None,
+                        bookmarked: Optional[FrozenSet[int]] = None) -> List[Place]:
+
+    # ix_place_lat_lng 인덱스로 위도 범위를 먼저 좁힌 뒤 경도 필터
+    query = db.query(PlaceModel).filter(
+        PlaceModel.latitude.between(min_lat, max_lat),
+        PlaceModel.longitude.between(min_lng, max_lng),
+        PlaceModel.is_deleted.is_(False)
+    )
+
+    bookmarked = _bookmarked_place_ids(db, current_user_id, bookmarked)
+    result = []
+    for place_model in query.limit(limit).all():
+        place_data = Place.model_validate(place_model)
+        place_data.is_bookmark = place_model.id in bookmarked
+        result.append(place_data)
 
     return result
 
+def get_viewport_clusters(db: Session,
+                          min_lat: float,
+                          min_lng: float,
+                          max_lat: float,
+                          max_lng: float,
+                          zoom: int) -> List[PlaceClusterModel]:
+
+    # 화면 모서리가 속한 클러스터 셀 범위 (타일 y 는 북쪽이 작다)
+    grid_zoom = zoom + settings.PLACE_CLUSTER_GRID_SHIFT
+    min_x, min_y = lat_lng_to_tile(max_lat, min_lng, grid_zoom)
+    max_x, max_y = lat_lng_to_tile(min_lat, max_lng, grid_zoom)
+
+    return (db.query(PlaceClusterModel)
+            .filter(PlaceClusterModel.zoom == zoom,
+                    PlaceClusterModel.tile_x.between(min_x, max_x),
+                    PlaceClusterModel.tile_y.between(min_y, max_y))
+            .all())
+
+def rebuild_place_clusters(db: Session) -> int:
+    """
+    모든 장소를 줌 레벨(0 ~ PLACE_CLUSTER_MAX_ZOOM)별 격자에 모아
+    place_cluster 테이블을 다시 만든다. 생성한 클러스터 수를 반환.
+    """
+    places = (db.query(PlaceModel.id, PlaceModel.latitude, PlaceModel.longitude)
+              .filter(PlaceModel.latitude.isnot(None), PlaceModel.longitude.isnot(None),
+                      PlaceModel.is_deleted.is_(False))
+              .all())
+
+    clusters = []
+    for zoom in range(settings.PLACE_CLUSTER_MAX_ZOOM + 1):
+        grid_zoom = zoom + settings.PLACE_CLUSTER_GRID_SHIFT
+
+        # 셀별 [개수, 위도 합, 경도 합, 첫 장소 id]
+        cells = {}
+        for place_id, lat, lng in places:
+            key = lat_lng_to_tile(lat, lng, grid_zoom)
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [1, lat, lng, place_id]
+            else:
+                cell[0] += 1
+                cell[1] += lat
+                cell[2] += lng
+
+        for (tile_x, tile_y), (count, lat_sum, lng_sum, place_id) in cells.items():
+            clusters.append({
+                "zoom": zoom,
+                "tile_x": tile_x,
+                "tile_y": tile_y,
+                "count": count,
+                "latitude": lat_sum / count,
+                "longitude": lng_sum / count,
+                "place_id": place_id if count == 1 else None,
+            })
+
+    db.query(PlaceClusterModel).delete()
+    if clusters:
+        db.bulk_insert_mappings(PlaceClusterModel, clusters)
+    db.commit()
+
+    return len(clusters)
+
+def get_data_version(db: Session, name: str) -> int:
+    version = db.query(DataVersionModel.version).filter(DataVersionModel.name == name).scalar()
+    return version or 0
+
+def bump_data_version(db: Session, name: str) -> int:
+    data_version = db.query(DataVersionModel).filter(DataVersionModel.name == name).first()
+    if data_version is None:
+        data_version = DataVersionModel(name=name, version=1)
+        db.add(data_version)
+    else:
+        data_version.version = DataVersionModel.version + 1
+
+    db.commit()
+    db.refresh(data_version)
+
+    return data_version.version
+
+def ensure_place_suggest_index(db: Session, index: PlaceSuggestIndex):
+    # 확인 주기마다 'place' 버전을 조회해서 바뀌었을 때만 인덱스를 다시 만든다
+    if not index.needs_check():
+        return
+
+    with index.lock:
+        if not index.needs_check():
+            return
+
+        version = get_data_version(db, "place")
+        if version != index.version:
+            places = db.query(PlaceModel.id, PlaceModel.name).filter(PlaceModel.is_deleted.is_(False)).all()
+            index.build(places, version)
+        else:
+            index.mark_checked()
+
 def get_bookmarks(db: Session,
                   offset: int,
                   limit: int,
                   search: str,
-                  current_user_id: Optional[int]) -> tuple[int, list[Bookmark]]:
+                  current_user_id: Optional[int],
+                  cursor: Optional[str] = None,
+                  include_total: bool = True,
+                  fast: bool = False) -> tuple[Optional[int], list[Bookmark], Optional[str]]:
+    """fast 면 필요한 컬럼만 튜플로 조회해 Bookmark 스키마와 같은 모양의 dict 목록을 반환 (Pydantic 검증 생략)"""
 
-    query = db.query(BookmarkModel).options(joinedload(BookmarkModel.place))
+    query = db.query(BookmarkModel)
     query = query.filter(BookmarkModel.user_id == current_user_id)
 
-    trim_search = search.strip()
-    if trim_search:
-        query = query.join(PlaceModel).filter(PlaceModel.name.like(f"%{trim_search}%"))
+    # 검색어가 있으면 장소 검색 조건으로 거르고 관련도 순으로 정렬
+    search_filter = _place_search_filter(search)
+    score = None
+    if search_filter is not None or fast:
+        query = query.join(PlaceModel, BookmarkModel.place_id == PlaceModel.id)
+    if search_filter is not None:
+        search_clause, score = search_filter
+        query = query.filter(search_clause)
 
-    total_count = query.count()
-    if total_count == 0:
-        return total_count, []
+    total_count = None
+    if include_total:
+        total_count = query.count()
+        if total_count == 0:
+            return total_count, [], None
 
-    result = query.offset(offset).limit(limit).all()
+    score_column = (score if score is not None else literal(0)).label("score")
+    if fast:
+        query = query.with_entities(BookmarkModel.id.label("bookmark_id"), *PLACE_FAST_COLUMNS, score_column)
+    else:
+        query = query.options(joinedload(BookmarkModel.place)).add_columns(score_column)
+
+    # 커서가 있으면 마지막으로 받은 (점수, 북마크 id) 다음부터 조회
+    if cursor:
+        if score is not None:
+            last_score, bookmark_id = decode_cursor(cursor, 2)
+            if not isinstance(last_score, int) or not isinstance(bookmark_id, int):
+                raise ValueError("Invalid cursor")
+            query = query.filter(or_(
+                score < last_score,
+                and_(score == last_score, BookmarkModel.id > bookmark_id)
+            ))
+        else:
+            bookmark_id, = decode_cursor(cursor, 1)
+            if not isinstance(bookmark_id, int):
+                raise ValueError("Invalid cursor")
+            query = query.filter(BookmarkModel.id > bookmark_id)
+        offset = 0
+
+    if score is not None:
+        query = query.order_by(score.desc())
+    rows = query.order_by(BookmarkModel.id).offset(offset).limit(limit + 1).all()
 
-    return total_count, result
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        last_id = last.bookmark_id if fast else last[0].id
+        next_cursor = encode_cursor([last.score, last_id] if score is not None else [last_id])
+
+    if fast:
+        result = [{"id": row.bookmark_id, "place_id": row.id, "place": _place_row_dict(row)} for row in rows]
+    else:
+        result = [bookmark for bookmark, _ in rows]
+
+    return total_count, result, next_cursor
 
 def create_bookmark(db: Session, place_id: int, user_id: int):
     bookmark = BookmarkModel(place_id=place_id, user_id=user_id)
     db.add(bookmark)
+    _clear_bookmark_tombstones(db, user_id, [place_id])
     db.commit()
     db.refresh(bookmark)
 
@@ -171,17 +850,193 @@ def delete_bookmark(db: Session, place_id: int, user_id: int):
 
     if bookmark:
         db.delete(bookmark)
+        db.add(SyncTombstoneModel(user_id=user_id, entity='bookmark', entity_id=place_id))
         db.commit()
 
         return True
 
     return False
 
+def update_bookmarks_batch(db: Session, user_id: int, add_place_ids: List[int], remove_place_ids: List[int]) -> dict:
+    """
+    여러 장소의 북마크 추가/삭제를 한 트랜잭션으로 처리한다.
+    이미 북마크한 장소는 uq_user_place_id 충돌을 무시하고(INSERT IGNORE) 넘어간다.
+    """
+    add_place_ids = [place_id for place_id, in db.query(PlaceModel.id).filter(PlaceModel.id.in_(set(add_place_ids)))]
+    remove_place_ids = set(remove_place_ids) - set(add_place_ids)
+
+    if add_place_ids:
+        rows = [{"user_id": user_id, "place_id": place_id} for place_id in add_place_ids]
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            stmt = mysql_insert(BookmarkModel).values(rows).prefix_with("IGNORE")
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(BookmarkModel).values(rows).on_conflict_do_nothing(
+                index_elements=["user_id", "place_id"])
+        else:
+            raise NotImplementedError(f"insert ignore is not supported for {dialect}")
+        db.execute(stmt)
+        _clear_bookmark_tombstones(db, user_id, add_place_ids)
+
+    removed = []
+    if remove_place_ids:
+        query = db.query(BookmarkModel).filter(BookmarkModel.user_id == user_id,
+                                               BookmarkModel.place_id.in_(remove_place_ids))
+        removed = [place_id for place_id, in query.with_entities(BookmarkModel.place_id)]
+        if removed:
+            query.delete(synchronize_session=False)
+            db.bulk_insert_mappings(SyncTombstoneModel, [
+                {"user_id": user_id, "entity": 'bookmark', "entity_id": place_id} for place_id in removed
+            ])
+
+    db.commit()
+
+    return {"added": sorted(add_place_ids), "removed": sorted(removed)}
+
+def get_bookmark_place_ids(db: Session, user_id: int) -> List[int]:
+    return [place_id for place_id, in (db.query(BookmarkModel.place_id)
+                                       .filter(BookmarkModel.user_id == user_id)
+                                       .order_by(BookmarkModel.place_id))]
+
+def _clear_bookmark_tombstones(db: Session, user_id: int, place_ids: List[int]):
+    # 다시 북마크한 장소의 삭제 기록은 지워서 동기화 시 삭제로 보이지 않게 한다
+    (db.query(SyncTombstoneModel)
+     .filter(SyncTombstoneModel.user_id == user_id,
+             SyncTombstoneModel.entity == 'bookmark',
+             SyncTombstoneModel.entity_id.in_(place_ids))
+     .delete(synchronize_session=False))
+
+def _parse_sync_key(value) -> Optional[Tuple[datetime, int]]:
+    if value is None:
+        return None
+    updated_at, entity_id = value
+    return datetime.fromisoformat(updated_at), int(entity_id)
+
+def _sync_key(updated_at: datetime, entity_id: int) -> list:
+    return [updated_at.isoformat(), entity_id]
+
+def _sync_time(db: Session, value):
+    """
+    /sync 에서 비교/정렬할 시각. SQLite 는 DATETIME 을 문자열로 저장하는데 func.now() 로 채운 값('... 11:31:58')과
+    파라미터로 넘긴 값('... 11:31:58.000000')의 형식이 달라 같은 시각이 다르게 비교되므로 datetime() 으로 맞춘다.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return func.datetime(value)
+    return value
+
+def _db_now(db: Session) -> datetime:
+    now = db.query(func.now()).scalar()
+    if isinstance(now, str):
+        now = datetime.fromisoformat(now)
+    return now
+
+def get_sync_changes(db: Session, current_user_id: int, since: Optional[str] = None,
+                     limit: int = settings.SYNC_PAGE_SIZE) -> dict:
+    """
+    since 워터마크 이후 생성/수정된 기록과 북마크, 삭제된 항목의 id 를 반환 (since 가 없으면 전체).
+    종류별로 (updated_at, id) 순서로 최대 limit 건씩 나눠 보내며, has_more 면 응답의 watermark 로 이어서 요청한다.
+    워터마크는 앱 서버가 아니라 DB 의 현재 시각을 기준으로 만들어 updated_at 과 같은 시계로 비교한다.
+    since 가 삭제 기록 보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)보다 오래되면 삭제를 알 수 없으므로 처음부터 다시 보내고 full_resync 를 표시한다.
+    """
+    # 워터마크: [since, 이번 동기화가 끝났을 때의 워터마크, 기록/북마크/삭제 기록의 마지막 위치]
+    since_at, upto, record_after, bookmark_after, tombstone_after = None, None, None, None, None
+    if since:
+        values = decode_cursor(since, 5)
+        try:
+            since_at = datetime.fromisoformat(values[0]) if values[0] is not None else None
+            upto = datetime.fromisoformat(values[1]) if values[1] is not None else None
+            record_after = _parse_sync_key(values[2])
+            bookmark_after = _parse_sync_key(values[3])
+            tombstone_after = int(values[4]) if values[4] is not None else None
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid watermark") from e
+
+    now = _db_now(db)
+    full_resync = False
+    if since_at is not None and since_at < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+        since_at, upto, record_after, bookmark_after, tombstone_after = None, None, None, None, None
+        full_resync = True
+
+    # 첫 페이지에서 정한 워터마크를 마지막 페이지까지 유지
+    if upto is None:
+        upto = now - timedelta(seconds=settings.SYNC_WATERMARK_LAG)
+
+    records = (db.query(RecordModel)
+               .options(joinedload(RecordModel.place))
+               .filter(RecordModel.user_id == current_user_id))
+    bookmarks = (db.query(BookmarkModel)
+                 .options(joinedload(BookmarkModel.place))
+                 .filter(BookmarkModel.user_id == current_user_id))
+
+    record_at = _sync_time(db, RecordModel.updated_at)
+    bookmark_at = _sync_time(db, BookmarkModel.updated_at)
+    if since_at is not None:
+        records = records.filter(record_at >= _sync_time(db, since_at))
+        bookmarks = bookmarks.filter(bookmark_at >= _sync_time(db, since_at))
+    if record_after is not None:
+        records = records.filter(tuple_(record_at, RecordModel.id) >
+                                 tuple_(_sync_time(db, record_after[0]), record_after[1]))
+    if bookmark_after is not None:
+        bookmarks = bookmarks.filter(tuple_(bookmark_at, BookmarkModel.id) >
+                                     tuple_(_sync_time(db, bookmark_after[0]), bookmark_after[1]))
+
+    # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+    records = records.order_by(record_at, RecordModel.id).limit(limit + 1).all()
+    bookmarks = bookmarks.order_by(bookmark_at, BookmarkModel.id).limit(limit + 1).all()
+    has_more = len(records) > limit or len(bookmarks) > limit
+    records, bookmarks = records[:limit], bookmarks[:limit]
+
+    deleted = {'record': [], 'bookmark': []}
+    if since_at is not None:
+        tombstones = (db.query(SyncTombstoneModel.id, SyncTombstoneModel.entity, SyncTombstoneModel.entity_id)
+                      .filter(SyncTombstoneModel.user_id == current_user_id,
+                              _sync_time(db, SyncTombstoneModel.deleted_at) >= _sync_time(db, since_at)))
+        if tombstone_after is not None:
+            tombstones = tombstones.filter(SyncTombstoneModel.id > tombstone_after)
+        tombstones = tombstones.order_by(SyncTombstoneModel.id).limit(limit + 1).all()
+        has_more = has_more or len(tombstones) > limit
+
+        for tombstone_id, entity, entity_id in tombstones[:limit]:
+            deleted.setdefault(entity, []).append(entity_id)
+            tombstone_after = tombstone_id
+
+    if has_more:
+        if records:
+            record_after = (records[-1].updated_at, records[-1].id)
+        if bookmarks:
+            bookmark_after = (bookmarks[-1].updated_at, bookmarks[-1].id)
+        watermark = [since_at.isoformat() if since_at is not None else None, upto.isoformat(),
+                     _sync_key(*record_after) if record_after else None,
+                     _sync_key(*bookmark_after) if bookmark_after else None,
+                     tombstone_after]
+    else:
+        watermark = [upto.isoformat(), None, None, None, None]
+
+    return {
+        "watermark": encode_cursor(watermark),
+        "has_more": has_more,
+        "full_resync": full_resync,
+        "records": records,
+        "bookmarks": bookmarks,
+        "deleted_record_ids": deleted['record'],
+        "deleted_bookmark_place_ids": deleted['bookmark'],
+    }
+
+def prune_sync_tombstones(db: Session) -> int:
+    """보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 삭제 기록을 지우고 지운 건수를 반환"""
+    cutoff = _db_now(db) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    deleted = (db.query(SyncTombstoneModel)
+               .filter(SyncTombstoneModel.deleted_at < cutoff)
+               .delete(synchronize_session=False))
+    db.commit()
+
+    return deleted
+
 def get_user_by_email(db: Session, email: str) -> User:
     return db.query(UserModel).filter(UserModel.email == email).first()
 
-def create_user(db: Session, user: UserCreate):
-    hash_password = pwd_context.hash(user.password)
+def create_user(db: Session, user: UserCreate, hash_password: str):
+    # 비밀번호 해시는 호출하는 쪽에서 util.password.password_hasher 로 미리 계산한다
     db_user = UserModel(
         nickname=user.nickname,
         email=user.email,
@@ -1,13 +1,133 @@
+import itertools
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import settings
+from util.metrics import metrics
+from util.pool_metrics import MeteredQueuePool, MeteredAsyncQueuePool, instrument_pool
+from util.request_metrics import instrument_engine
+from util.slow_query import SlowQueryLog
+
+# 동기 드라이버 -> 같은 DB 의 비동기 드라이버
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(database_url: str):
+    url = make_url(database_url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+def pool_options(url, pool_class) -> dict:
+    """config 의 커넥션 풀 설정. 메모리 SQLite 는 연결 하나를 공유하는 풀을 그대로 쓴다."""
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
 
 query_debug = False
-engine = create_engine(settings.database_url, echo=query_debug)
+engine = create_engine(settings.database_url, echo=query_debug,
+                       **pool_options(settings.database_url, MeteredQueuePool))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 라우터용 엔진/세션 (crud/async_crud.py 참고)
+async_database_url = to_async_url(settings.database_url)
+async_engine = create_async_engine(async_database_url, echo=query_debug,
+                                   **pool_options(async_database_url, MeteredAsyncQueuePool))
+
+# 커넥션 풀 사용량/포화도 (/metrics)
+if isinstance(engine.pool, MeteredQueuePool):
+    instrument_pool(engine, "sync", settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+if isinstance(async_engine.pool, MeteredAsyncQueuePool):
+    instrument_pool(async_engine.sync_engine, "async", settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+
+# 요청별 SQL 실행 횟수/시간 수집 (/metrics)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+# 느린 쿼리 기록 (/admin/slow-queries)
+slow_query_log = SlowQueryLog(threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+                              explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+                              maxlen=settings.SLOW_QUERY_LOG_SIZE)
+slow_query_log.instrument(engine)
+slow_query_log.instrument(async_engine.sync_engine)
+
+# 커밋 후 속성 접근이 이벤트 루프에서 지연 로딩을 일으키지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+class ReadReplicas:
+    """
+    읽기 전용 API 용 복제본 세션 팩토리 묶음.
+    round_robin 은 차례대로, least_busy 는 사용 중인 연결이 가장 적은 복제본을 고른다 (같으면 차례대로).
+    """
+
+    SELECTIONS = ("round_robin", "least_busy")
+
+    def __init__(self, urls, selection: str = "round_robin"):
+        if selection not in self.SELECTIONS:
+            raise ValueError(f"Unknown replica selection: {selection}")
+
+        self.selection = selection
+        self.engines = []
+        self.sessionmakers = []
+        for index, url in enumerate(urls):
+            # 풀 메트릭은 replica0, replica1 ... 로 구분
+            label = f"replica{index}"
+            async_url = to_async_url(url)
+            replica_engine = create_async_engine(async_url, echo=query_debug,
+                                                 **pool_options(async_url, MeteredAsyncQueuePool.labelled(label)))
+            if isinstance(replica_engine.pool, MeteredAsyncQueuePool):
+                instrument_pool(replica_engine.sync_engine, label, settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+            instrument_engine(replica_engine.sync_engine)
+            slow_query_log.instrument(replica_engine.sync_engine)
+            self.engines.append(replica_engine)
+            self.sessionmakers.append(async_sessionmaker(replica_engine, autoflush=False, expire_on_commit=False))
+        self._counter = itertools.count()
+
+    def choose(self) -> async_sessionmaker:
+        start = next(self._counter) % len(self.sessionmakers)
+        if self.selection == "round_robin":
+            return self.sessionmakers[start]
+
+        order = [(start + i) % len(self.engines) for i in range(len(self.engines))]
+        index = min(order, key=lambda i: getattr(self.engines[i].pool, "checkedout", lambda: 0)())
+        return self.sessionmakers[index]
+
+
+replica_urls = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+read_replicas = ReadReplicas(replica_urls, settings.DATABASE_REPLICA_SELECTION) if replica_urls else None
+
+metrics.describe("db_read_routing_total", "counter",
+                 "Read-only sessions by target (replica, primary: no replica configured, sticky: recent writer)")
+
+
+def read_session_factory(sticky: bool = False) -> async_sessionmaker:
+    """
+    읽기 전용 요청의 세션 팩토리. 복제본이 없거나 sticky(방금 쓰기를 한 클라이언트, util/read_your_writes.py)면 primary.
+    """
+    if read_replicas is None:
+        metrics.inc("db_read_routing_total", target="primary")
+        return AsyncSessionLocal
+    if sticky:
+        metrics.inc("db_read_routing_total", target="sticky")
+        return AsyncSessionLocal
+
+    metrics.inc("db_read_routing_total", target="replica")
+    return read_replicas.choose()
+
 Base = declarative_base()
 
 def get_db():
@@ -16,3 +136,26 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def warm_up_pools(size: int = settings.DB_POOL_WARMUP_SIZE):
+    """
+    동기/비동기 엔진(과 복제본) 풀에 연결을 미리 만들어 둔다. 첫 요청들이 연결 생성(TCP, 인증) 비용을 내지 않게
+    서버 시작 시 호출한다. 풀 크기를 넘겨 만들면 반납할 때 닫히므로 DB_POOL_SIZE 까지만.
+    """
+    size = min(size, settings.DB_POOL_SIZE)
+    if size <= 0:
+        return
+
+    connections = [engine.connect() for _ in range(size)]
+    for connection in connections:
+        connection.close()
+
+    async_engines = [async_engine] + (read_replicas.engines if read_replicas is not None else [])
+    for warm_engine in async_engines:
+        async_connections = [await warm_engine.connect() for _ in range(size)]
+        for connection in async_connections:
+            await connection.close()
@@ -1,4 +1,6 @@
-from fastapi import Request
+import secrets
+
+from fastapi import Request, Response, Header
 from sqlalchemy.orm.session import Session
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
@@ -6,16 +8,28 @@ from jose import JWTError, jwt
 from fastapi import HTTPException, status
 
 from config import settings
-from db.database import get_db
+from db.database import get_db, AsyncSessionLocal, read_session_factory
 from models.db_models import UserModel
-from schemas.models import TokenData
+from schemas.models import TokenData, UserLoginResponse
 from datetime import datetime, timedelta
 from typing import Optional
 from crud import crud
+from sqlalchemy import event
+from util.cache import TTLCache
+from util.metrics import metrics
+from util.read_your_writes import mark_last_write, is_recent_writer
 
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+# 로그인하지 않아도 되는 API 용 (토큰이 없으면 None)
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
+
+# 토큰의 sub(유저 id) -> UserLoginResponse
+user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+
+metrics.describe("auth_user_lookups_total", "counter",
+                 "Authenticated user resolutions by source (token: DB lookup skipped, cache: served from user cache, db: DB lookup)")
 
 def create_access_token(data: dict, expires: Optional[int] = None):
     to_encode = data.copy()
@@ -26,8 +40,7 @@ def create_access_token(data: dict, expires: Optional[int] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def get_current_user(db: Session = Depends(get_db),
-                     token: str = Depends(oauth2_scheme)):
+def _decode_user_id(token: str) -> str:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -42,12 +55,100 @@ def get_current_user(db: Session = Depends(get_db),
     except JWTError:
         raise credentials_exception
 
-    user = crud.get_user_by_id(db, user_id=token_data.user_id)
+    return token_data.user_id
+
+def get_current_user(db: Session = Depends(get_db),
+                     token: str = Depends(oauth2_scheme)) -> UserLoginResponse:
+    user_id = _decode_user_id(token)
+
+    # 유저 정보는 TTL 캐시에서 먼저 찾고, 없을 때만 DB 조회
+    cached_user = user_cache.get(user_id)
+    if cached_user is not None:
+        metrics.inc("auth_user_lookups_total", source="cache")
+        return cached_user
+
+    metrics.inc("auth_user_lookups_total", source="db")
+    user = crud.get_user_by_id(db, user_id=user_id)
     if user is None:
-        raise credentials_exception
-    return user
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    current_user = UserLoginResponse.model_validate(user)
+    user_cache.set(user_id, current_user)
+    return current_user
+
+def _resolve_user_id(db: Session, token: str) -> int:
+    # 서명이 검증된 토큰의 sub 를 그대로 믿으면 유저 id 만 필요한 요청은 DB 를 조회하지 않는다
+    if settings.AUTH_TRUST_TOKEN_SUB:
+        user_id = _decode_user_id(token)
+        try:
+            current_user_id = int(user_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        metrics.inc("auth_user_lookups_total", source="token")
+        return current_user_id
 
-def get_current_user_id(current_user: UserModel = Depends(get_current_user)):
-    current_user_id = current_user.id
+    current_user = get_current_user(db, token)
+    return current_user.id
+
+def get_optional_current_user_id(db: Session = Depends(get_db),
+                                 token: Optional[str] = Depends(optional_oauth2_scheme)) -> Optional[int]:
+    # 토큰이 있으면 검증해서 유저 id 를, 없으면 비로그인(None)으로 처리
+    if not token:
+        return None
+
+    return _resolve_user_id(db, token)
+
+def get_current_user_id(current_user_id: Optional[int] = Depends(get_optional_current_user_id)) -> int:
+    # get_optional_current_user_id 위에 만들어 한 요청에서 토큰은 한 번만 검증한다
+    # (FastAPI 가 요청마다 의존성 결과를 재사용하므로 get_async_read_db 와 같은 결과를 공유)
+    if current_user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     return current_user_id
+
+async def get_async_read_db(request: Request,
+                            current_user_id: Optional[int] = Depends(get_optional_current_user_id)):
+    """
+    읽기 전용 API 의 DB 세션. 복제본이 설정되어 있으면 복제본을 쓰고,
+    최근에 쓰기를 한 클라이언트(요청의 마지막 쓰기 쿠키/헤더)는 자기 변경이 바로 보이도록 primary 를 쓴다.
+    """
+    async with read_session_factory(sticky=is_recent_writer(request, current_user_id))() as db:
+        yield db
+
+async def get_async_write_db(response: Response, current_user_id: int = Depends(get_current_user_id)):
+    # primary 세션. 커밋하면 응답에 마지막 쓰기 표시를 붙여 이후 읽기가 잠시 primary 로 가게 한다
+    async with AsyncSessionLocal() as db:
+        db.sync_session.info["write_response"] = (response, current_user_id)
+        yield db
+
+def verify_admin_key(x_admin_key: Optional[str] = Header(None)):
+    # ADMIN_API_KEY 가 설정되지 않았으면 관리자 API 를 열지 않는다
+    if not settings.ADMIN_API_KEY or not x_admin_key \
+            or not secrets.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin key")
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_last_write(session):
+    # get_async_write_db 로 만든 세션만 write_response 가 있다 (응답을 보내기 전, 엔드포인트 안에서 호출됨)
+    write_response = session.info.get("write_response")
+    if write_response is not None:
+        mark_last_write(*write_response)
+
+
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _invalidate_cached_user(mapper, connection, target):
+    user_cache.invalidate(str(target.id))
@@ -1,23 +1,31 @@
+import logging
 from typing import Optional, AnyStr
 
 from fastapi import FastAPI, Request, Depends, HTTPException, status, Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm.session import Session
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
 
 from crud import crud
 from dependencies import create_access_token, get_current_user
 from models.db_models import UserModel
-from routers import place, bookmark, record, user
-from db.database import engine, get_db
+from routers import place, bookmark, record, user, sync, admin
+from db.database import engine, get_db, SessionLocal, warm_up_pools
 from models import db_models
 import uvicorn
 from schemas.models import User, UserCreate, APIResponse, Token, TokenData, UserLoginResponse
 from config import settings
+from util.suggest import place_suggest_index
+from util.metrics import metrics
+from util.social_client import social_profile_client
+from util.compression import CompressionMiddleware
+from util.request_metrics import RequestMetricsMiddleware
+
+logger = logging.getLogger(__name__)
 
 # 데이터베이스 테이블 생성
 db_models.Base.metadata.create_all(bind=engine)
@@ -38,6 +46,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 읽기 라우팅용 마지막 쓰기 표시 (util/read_your_writes.py)
+    expose_headers=["X-Last-Write"],
 )
 
 # 라우터 등록
@@ -45,8 +55,46 @@ app.include_router(place.router)
 app.include_router(bookmark.router)
 app.include_router(record.router)
 app.include_router(user.router)
+app.include_router(sync.router)
+app.include_router(admin.router)
 
 app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 
+# 응답 압축 (가장 바깥에서 최종 본문을 압축하도록 마지막에 추가)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
+# 요청별 지연 시간/상태 코드/SQL 횟수 기록 (압축까지 포함한 전체 처리 시간을 재도록 가장 바깥에 둠)
+app.add_middleware(RequestMetricsMiddleware)
+
+@app.on_event("startup")
+def build_place_indexes():
+    # 자동완성 인덱스를 미리 만들어 첫 요청이 느려지지 않게 한다
+    db = SessionLocal()
+    try:
+        crud.ensure_place_suggest_index(db, place_suggest_index)
+    finally:
+        db.close()
+
+@app.on_event("startup")
+async def warm_up_db_pools():
+    # 첫 요청들이 DB 연결을 새로 만드느라 느려지지 않게 풀을 미리 채움 (실패해도 서버는 시작)
+    try:
+        await warm_up_pools()
+    except Exception:
+        logger.warning("DB 커넥션 풀 준비 중 오류가 발생했습니다", exc_info=True)
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    await social_profile_client.close()
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
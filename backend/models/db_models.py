@@ -1,4 +1,5 @@
-from sqlalchemy import func, Column, Integer, String, Float, ForeignKey, UniqueConstraint, Date, Time, Text, DateTime
+from sqlalchemy import func, Column, Integer, String, Float, ForeignKey, UniqueConstraint, Index, Date, Time, Text, DateTime, \
+    Boolean, false
 from sqlalchemy.orm import relationship
 
 from db.database import Base
@@ -13,19 +14,70 @@ class PlaceModel(Base):
     y_position = Column(String(100), nullable=False)
     image_url = Column(String(500), nullable=False)
 
+    # 위치 검색용 숫자 좌표 및 geohash (util/geo.py 참고)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12), index=True, nullable=True)
+
+    # 증분 동기화용 원천 데이터 정보 (scripts/sync_place.py 참고)
+    source = Column(String(50), nullable=True)  # 원천 파일 이름 (예: jonghab)
+    source_id = Column(String(100), nullable=True)  # 원천 데이터 키 (opnsfteamcode-mgtno)
+    fingerprint = Column(String(40), nullable=True)  # 원천 레코드 정규화 필드의 해시
+    sync_run_id = Column(Integer, nullable=True)  # 마지막으로 원천 데이터에서 확인된 동기화 실행 id
+    is_deleted = Column(Boolean, nullable=False, default=False, server_default=false())  # 폐업 등으로 숨긴 장소
+    deleted_at = Column(DateTime, nullable=True)
+
     bookmark = relationship("BookmarkModel", back_populates="place")
 
+    __table_args__ = (
+        Index('ix_place_lat_lng', 'latitude', 'longitude'),
+        # 적재 스크립트의 upsert 기준 키
+        UniqueConstraint('name', 'address', name='uq_place_name_address'),
+        # 증분 동기화의 비교 기준 키
+        UniqueConstraint('source', 'source_id', name='uq_place_source'),
+        Index('ix_place_source_run', 'source', 'sync_run_id'),
+    )
+
+class PlaceClusterModel(Base):
+    """줌 레벨별로 미리 집계한 지도 클러스터 (scripts/load_place.py 실행 시 재생성)"""
+    __tablename__ = 'place_cluster'
+
+    id = Column(Integer, primary_key=True)
+    zoom = Column(Integer, nullable=False)
+    tile_x = Column(Integer, nullable=False)
+    tile_y = Column(Integer, nullable=False)
+    count = Column(Integer, nullable=False)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    place_id = Column(Integer, nullable=True)  # 장소가 하나뿐인 클러스터의 장소 id
+
+    __table_args__ = (
+        Index('ix_place_cluster_zoom_tile', 'zoom', 'tile_x', 'tile_y'),
+    )
+
+class PlaceSearchGramModel(Base):
+    """장소 이름/주소의 n-gram 역색인 (util/search.py 참고)"""
+    __tablename__ = 'place_search_gram'
+
+    gram = Column(String(10), primary_key=True)
+    field = Column(String(10), primary_key=True)  # 'name' 또는 'address'
+    place_id = Column(Integer, ForeignKey('place.id'), primary_key=True, index=True)
+
 class BookmarkModel(Base):
     __tablename__ = 'bookmark'
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('user.id'), nullable=False)
     place_id = Column(Integer, ForeignKey('place.id'), nullable=False)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     place = relationship("PlaceModel", back_populates="bookmark")
     user = relationship("UserModel", back_populates="bookmark")
 
     __table_args__ = (
         UniqueConstraint('user_id', 'place_id', name='uq_user_place_id'),
+        # 변경분 동기화(/sync) 조회용
+        Index('ix_bookmark_user_updated', 'user_id', 'updated_at'),
     )
 
 
@@ -42,11 +94,21 @@ class RecordModel(Base):
     pool_length = Column(Float, nullable=False)
     swim_distance = Column(Integer, nullable=False)
     memo = Column(Text, nullable=False)
+    client_id = Column(String(64), nullable=True)  # 오프라인 동기화 시 앱이 만든 멱등성 키
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     place = relationship("PlaceModel")
 
+    __table_args__ = (
+        # 유저별 기록 목록의 정렬 및 커서 조회용
+        Index('ix_record_user_date_time', 'user_id', 'record_date', 'start_time'),
+        # 같은 기록을 다시 올려도 중복 생성되지 않도록
+        UniqueConstraint('user_id', 'client_id', name='uq_record_user_client'),
+        # 변경분 동기화(/sync) 조회용
+        Index('ix_record_user_updated', 'user_id', 'updated_at'),
+    )
+
 class UserModel(Base):
     __tablename__ = 'user'
 
@@ -60,4 +122,61 @@ class UserModel(Base):
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
-    bookmark = relationship("BookmarkModel", back_populates="user")
\ No newline at end of file
+    bookmark = relationship("BookmarkModel", back_populates="user")
+
+class DataVersionModel(Base):
+    """데이터 묶음별 버전 (예: 'place'). 적재 스크립트가 올리면 각 서버 프로세스가 인메모리 인덱스를 다시 만든다."""
+    __tablename__ = 'data_version'
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+class PlaceSyncRunModel(Base):
+    """원천 파일별 장소 증분 동기화 실행 기록. position 까지 반영된 상태로 중단되면 다음 실행이 이어서 진행한다."""
+    __tablename__ = 'place_sync_run'
+
+    id = Column(Integer, primary_key=True)
+    source = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default='running')  # 'running', 'done'
+    position = Column(Integer, nullable=False, default=0)  # 반영을 마친 원천 레코드 수
+    inserted = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    deleted = Column(Integer, nullable=False, default=0)
+    unchanged = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime, default=func.now())
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_place_sync_run_source_status', 'source', 'status'),
+    )
+
+class RecordRollupModel(Base):
+    """유저/집계 구간/장소별 수영 기록 합계. create_record 에서 증분 갱신 (util/period.py 참고)"""
+    __tablename__ = 'record_rollup'
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('user.id'), nullable=False)
+    period = Column(String(10), nullable=False)  # 'week', 'month', 'year'
+    period_start = Column(Date, nullable=False)
+    place_id = Column(Integer, ForeignKey('place.id'), nullable=False)
+    distance = Column(Integer, nullable=False, default=0)
+    duration_seconds = Column(Integer, nullable=False, default=0)
+    session_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'period', 'period_start', 'place_id', name='uq_record_rollup'),
+    )
+
+class SyncTombstoneModel(Base):
+    """변경분 동기화(/sync)로 앱에 삭제를 알리기 위한 삭제 기록"""
+    __tablename__ = 'sync_tombstone'
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('user.id'), nullable=False)
+    entity = Column(String(20), nullable=False)  # 'record', 'bookmark'
+    entity_id = Column(Integer, nullable=False)  # record 는 기록 id, bookmark 는 장소 id
+    deleted_at = Column(DateTime, default=func.now())
+
+    __table_args__ = (
+        Index('ix_sync_tombstone_user_deleted', 'user_id', 'deleted_at'),
+    )
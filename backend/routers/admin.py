@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from crud import async_crud
+from schemas.models import SlowQueryLogResponse, APIResponse
+from db.database import slow_query_log, get_async_db
+from dependencies import verify_admin_key
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin_key)],
+    responses={403: {"description": "Invalid admin key"}},
+)
+
+@router.get("/slow-queries", response_model=SlowQueryLogResponse)
+def get_slow_queries(limit: int = Query(50, ge=1, le=1000, description="최근 항목부터 최대 항목 수")):
+    return {"threshold_ms": slow_query_log.threshold_ms, "result": slow_query_log.entries(limit)}
+
+@router.delete("/slow-queries", response_model=APIResponse)
+def clear_slow_queries():
+    slow_query_log.clear()
+    return APIResponse(
+        success=True,
+        message="Slow query log cleared successfully"
+    )
+
+@router.delete("/sync-tombstones", response_model=APIResponse)
+async def prune_sync_tombstones(db: AsyncSession = Depends(get_async_db)):
+    # 보관 기간이 지난 /sync 삭제 기록 정리 (주기적으로 호출)
+    deleted = await async_crud.prune_sync_tombstones(db)
+    return APIResponse(
+        success=True,
+        message="Expired sync tombstones pruned successfully",
+        data={"deleted": deleted}
+    )
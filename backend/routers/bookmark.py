@@ -1,10 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Header
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from crud import crud
-from schemas.models import BookmarkPagingResponse, APIResponse, BookmarkCreate
-from db.database import get_db
-from dependencies import get_current_user_id
+from crud import async_crud
+from schemas.models import BookmarkPagingResponse, APIResponse, BookmarkCreate, BookmarkBatchUpdate, \
+    BookmarkBatchResponse, BookmarkIdsResponse
+from dependencies import get_current_user_id, get_async_read_db, get_async_write_db
+from util.encoding import negotiate_list_format, encoded_response
+from util.bitmap import encode_id_bitmap
 
 router = APIRouter(
     prefix="/bookmarks",
@@ -16,23 +19,62 @@ router = APIRouter(
 async def get_bookmarks(
         page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
         size: int = Query(10, ge=1, le=50, description="페이지당 항목 수 (최대 50)"),
-        search: Optional[str] = Query('', description="검색할 장소 이름"),
-        db: Session = Depends(get_db),
+        search: Optional[str] = Query('', description="검색할 장소 이름 또는 주소"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정하면 page 는 무시)"),
+        include_total: bool = Query(False, description="cursor 조회 시 total 포함 여부"),
+        fast: bool = Query(False, description="true 면 스키마 검증 없이 바로 직렬화 (응답 형식은 같음)"),
+        accept: Optional[str] = Header(None, include_in_schema=False),
+        db: AsyncSession = Depends(get_async_read_db),
         current_user_id = Depends(get_current_user_id)):
 
     offset = (page - 1) * size
-    total_count, result = crud.get_bookmarks(db, offset=offset, limit=size, search=search, current_user_id=current_user_id)
+    # columnar JSON / MessagePack 은 빠른 경로의 dict 를 그대로 변환
+    fmt = negotiate_list_format(accept)
+    fast = fast or fmt != "json"
+    try:
+        total_count, result, next_cursor = await async_crud.get_bookmarks(
+            db, offset=offset, limit=size, search=search, current_user_id=current_user_id,
+            cursor=cursor, include_total=include_total or not cursor, fast=fast)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return {"total": total_count, "result": result}
+    if fmt != "json":
+        return encoded_response({"total": total_count, "result": result, "next_cursor": next_cursor}, fmt, "/bookmarks/")
+    if fast:
+        return ORJSONResponse({"total": total_count, "result": result, "next_cursor": next_cursor})
 
+    return {"total": total_count, "result": result, "next_cursor": next_cursor}
+
+
+@router.get("/ids", response_model=BookmarkIdsResponse)
+async def get_bookmark_ids(
+        format: str = Query("array", pattern="^(array|bitmap)$", description="array 또는 bitmap"),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user_id = Depends(get_current_user_id)):
+
+    place_ids = await async_crud.get_bookmark_place_ids(db, user_id=current_user_id)
+
+    if format == "bitmap":
+        return {"format": format, "count": len(place_ids), "bitmap": encode_id_bitmap(place_ids)}
+
+    return {"format": format, "count": len(place_ids), "place_ids": place_ids}
+
+@router.post("/batch", response_model=BookmarkBatchResponse)
+async def update_bookmarks_batch(
+        data: BookmarkBatchUpdate,
+        db: AsyncSession = Depends(get_async_write_db),
+        current_user_id = Depends(get_current_user_id)):
+
+    return await async_crud.update_bookmarks_batch(
+        db, user_id=current_user_id, add_place_ids=data.add, remove_place_ids=data.remove)
 
 @router.post("/", response_model=APIResponse)
 async def create_bookmark(
         data: BookmarkCreate,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_write_db),
         current_user_id = Depends(get_current_user_id)):
 
-    bookmark = crud.create_bookmark(db, place_id=data.place_id, user_id=current_user_id)
+    bookmark = await async_crud.create_bookmark(db, place_id=data.place_id, user_id=current_user_id)
     if bookmark is None:
         raise HTTPException(status_code=404, detail="Place not found")
 
@@ -44,10 +86,10 @@ async def create_bookmark(
 @router.delete("/{place_id}", response_model=APIResponse)
 async def delete_bookmark(
         place_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_write_db),
         current_user_id = Depends(get_current_user_id)):
 
-    result = crud.delete_bookmark(db, place_id=place_id, user_id=current_user_id)
+    result = await async_crud.delete_bookmark(db, place_id=place_id, user_id=current_user_id)
 
     return APIResponse(
         success=result,
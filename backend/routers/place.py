@@ -1,9 +1,28 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, Header
+from fastapi.responses import ORJSONResponse
+import orjson
 from sqlalchemy.orm import Session
-from crud import crud
-from schemas.models import Place, PlacePagingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List
+from crud import crud, async_crud
+from config import settings
+from schemas.models import Place, PlacePagingResponse, PlaceNearbyResponse, PlaceViewportResponse, PlaceSuggestion
 from db.database import get_db
-from dependencies import get_current_user_id
+from dependencies import get_current_user_id, get_optional_current_user_id, get_async_read_db
+from util.suggest import place_suggest_index
+from util.search import normalize_text
+from util.metrics import metrics, route_label
+from util.response_cache import ResponseCache, etag_matches
+from util.encoding import negotiate_list_format, encode_payload, encoded_response, record_bytes_saved, \
+    FORMAT_MEDIA_TYPES
+
+# 비로그인 장소 목록/상세의 직렬화된 응답 캐시 ('place' 데이터 버전이 바뀌면 비움)
+place_response_cache = ResponseCache(maxsize=settings.PLACE_RESPONSE_CACHE_SIZE,
+                                     ttl=settings.PLACE_RESPONSE_CACHE_TTL,
+                                     check_interval=settings.PLACE_VERSION_CHECK_INTERVAL)
+
+metrics.describe("place_response_cache_total", "counter",
+                 "Anonymous place responses by endpoint and result (hit, miss, not_modified)")
 
 router = APIRouter(
     prefix="/places",
@@ -13,28 +32,146 @@ router = APIRouter(
 
 @router.get("/", response_model=PlacePagingResponse)
 async def get_places(
+        request: Request,
         page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
         size: int = Query(10, ge=1, le=50, description="페이지당 항목 수 (최대 50)"),
-        search: str = Query('', description="검색할 장소 이름"),
-        db: Session = Depends(get_db),
-        current_user_id: int = Depends(get_current_user_id)):
+        search: str = Query('', description="검색할 장소 이름 또는 주소"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정하면 page 는 무시)"),
+        include_total: bool = Query(False, description="cursor 조회 시 total 포함 여부"),
+        fast: bool = Query(False, description="true 면 스키마 검증 없이 바로 직렬화 (응답 형식은 같음)"),
+        accept: Optional[str] = Header(None, include_in_schema=False),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user_id: Optional[int] = Depends(get_optional_current_user_id)):
 
-    print('current_user_id', current_user_id)
     offset = (page - 1) * size
-    total_count, result = crud.get_places(db, offset=offset, limit=size, search=search, current_user_id=current_user_id)
+    fmt = negotiate_list_format(accept)
+    include_total = include_total or not cursor
+
+    async def load(fast: bool):
+        try:
+            total_count, result, next_cursor = await async_crud.get_places(
+                db, offset=offset, limit=size, search=search, current_user_id=current_user_id,
+                cursor=cursor, include_total=include_total, fast=fast)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        if fast:
+            return {"total": total_count, "result": result, "next_cursor": next_cursor}
+        return PlacePagingResponse(total=total_count, result=result, next_cursor=next_cursor)
+
+    # 북마크 여부가 유저마다 다르므로 비로그인 요청만 캐시 (캐시할 본문은 빠른 경로로 만들어도 같은 JSON)
+    if current_user_id is None:
+        key = ("list", normalize_text(search), page if not cursor else None, size, cursor, include_total, fmt)
+        return await _cached_response(request, db, "list", key, lambda: load(fast=True), fmt=fmt)
+
+    # columnar JSON / MessagePack 은 빠른 경로의 dict 를 그대로 변환
+    if fmt != "json":
+        return encoded_response(await load(fast=True), fmt, "/places/")
+    if fast:
+        return ORJSONResponse(await load(fast=True))
+
+    return await load(fast=False)
+
+@router.get("/suggest", response_model=List[PlaceSuggestion])
+def suggest_places(
+        q: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어 (초성 검색 가능)"),
+        limit: int = Query(10, ge=1, le=20, description="최대 항목 수 (최대 20)"),
+        db: Session = Depends(get_db)):
+
+    crud.ensure_place_suggest_index(db, place_suggest_index)
+
+    return place_suggest_index.search(q, limit=limit)
+
+@router.get("/nearby", response_model=PlaceNearbyResponse)
+async def get_nearby_places(
+        lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+        lng: float = Query(..., ge=-180, le=180, description="기준 경도"),
+        radius: float = Query(3000, gt=0, le=50000, description="검색 반경 (미터, 최대 50km)"),
+        limit: int = Query(20, ge=1, le=50, description="최대 항목 수 (최대 50)"),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user_id: int = Depends(get_current_user_id)):
 
-    return {"total": total_count, "result": result}
+    result = await async_crud.get_nearby_places(db, lat=lat, lng=lng, radius=radius, limit=limit,
+                                                current_user_id=current_user_id)
+
+    return {"total": len(result), "result": result}
+
+@router.get("/viewport", response_model=PlaceViewportResponse)
+async def get_viewport_places(
+        min_lat: float = Query(..., ge=-90, le=90, description="화면 남쪽 위도"),
+        min_lng: float = Query(..., ge=-180, le=180, description="화면 서쪽 경도"),
+        max_lat: float = Query(..., ge=-90, le=90, description="화면 북쪽 위도"),
+        max_lng: float = Query(..., ge=-180, le=180, description="화면 동쪽 경도"),
+        zoom: int = Query(..., ge=0, le=21, description="지도 줌 레벨"),
+        limit: int = Query(300, ge=1, le=1000, description="개별 장소 최대 항목 수 (최대 1000)"),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user_id: int = Depends(get_current_user_id)):
+
+    if min_lat > max_lat or min_lng > max_lng:
+        raise HTTPException(status_code=400, detail="Invalid viewport bounds")
+
+    # 낮은 줌 레벨에서는 미리 집계한 클러스터를 반환
+    if zoom <= settings.PLACE_CLUSTER_MAX_ZOOM:
+        clusters = await async_crud.get_viewport_clusters(db, min_lat=min_lat, min_lng=min_lng,
+                                                          max_lat=max_lat, max_lng=max_lng, zoom=zoom)
+        return {"zoom": zoom, "clustered": True, "clusters": clusters}
+
+    places = await async_crud.get_viewport_places(db, min_lat=min_lat, min_lng=min_lng,
+                                                  max_lat=max_lat, max_lng=max_lng, limit=limit,
+                                                  current_user_id=current_user_id)
+    return {"zoom": zoom, "clustered": False, "places": places}
 
 @router.get("/{place_id}", response_model=Place)
 async def get_place_detail(
         place_id: int,
-        db: Session = Depends(get_db),
-        current_user_id: int = Depends(get_current_user_id)):
+        request: Request,
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user_id: Optional[int] = Depends(get_optional_current_user_id)):
+
+    async def load():
+        result = await async_crud.get_place_detail(db, place_id=place_id, current_user_id=current_user_id)
+
+        if result is None:
+            raise HTTPException(status_code=404, detail="Place not found")
+
+        return result
+
+    if current_user_id is None:
+        return await _cached_response(request, db, "detail", ("detail", place_id), load)
+
+    return await load()
+
+async def _cached_response(request: Request, db: AsyncSession, endpoint: str, key, load,
+                           fmt: str = "json") -> Response:
+    """
+    캐시에 직렬화된 응답이 있으면 그대로 돌려주고, 없으면 load() 결과를 한 번만 직렬화해 캐시한다.
+    fmt 가 json 이 아니면 목록을 columnar JSON / MessagePack 으로 직렬화 (key 에 fmt 가 포함되어야 함).
+    If-None-Match 가 ETag 와 같으면 본문 없이 304 를 반환.
+    """
+    if place_response_cache.needs_check():
+        place_response_cache.set_generation(await async_crud.get_data_version(db, "place"))
 
-    result = crud.get_place_detail(db, place_id=place_id, current_user_id=current_user_id)
+    cached = place_response_cache.get(key)
+    if cached is None:
+        result = await load()
+        bytes_saved = 0
+        if fmt != "json":
+            body, _, bytes_saved = encode_payload(result, fmt)
+        else:
+            body = orjson.dumps(result) if isinstance(result, dict) else result.model_dump_json().encode("utf-8")
+        body, etag, bytes_saved = place_response_cache.set(key, body, bytes_saved)
+        cache_result = "miss"
+    else:
+        body, etag, bytes_saved = cached
+        cache_result = "hit"
 
-    if result is None:
-        raise HTTPException(status_code=404, detail="Place not found")
+    # 로그인 여부(Authorization)에 따라 is_bookmark 가 달라지므로 공유 캐시가 비로그인 응답을 로그인 유저에게 주지 않게 함
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept, Authorization"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        metrics.inc("place_response_cache_total", endpoint=endpoint, result="not_modified")
+        return Response(status_code=304, headers=headers)
+    metrics.inc("place_response_cache_total", endpoint=endpoint, result=cache_result)
 
-    return result
+    record_bytes_saved(bytes_saved, fmt, route_label(request.scope))
+    return Response(content=body, media_type=FORMAT_MEDIA_TYPES[fmt], headers=headers)
 
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
-from crud import crud
+from fastapi import APIRouter, HTTPException, Depends, Query, Header
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import Optional
+from crud import async_crud
 from models.db_models import RecordModel
-from schemas.models import Place, PlacePagingResponse, RecordPagingResponse, APIResponse, RecordCreate
-from db.database import get_db
-from dependencies import get_current_user_id
+from schemas.models import Place, PlacePagingResponse, RecordPagingResponse, APIResponse, RecordCreate, \
+    RecordStatsResponse, RecordCalendarResponse, RecordBatchCreate, RecordBatchResponse
+from dependencies import get_current_user_id, get_async_read_db, get_async_write_db
+from util.encoding import negotiate_list_format, encoded_response
 
 router = APIRouter(
     prefix="/records",
@@ -13,36 +17,91 @@ router = APIRouter(
 )
 
 @router.get("/", response_model=RecordPagingResponse)
-def get_records(
+async def get_records(
         page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
         size: int = Query(10, ge=1, le=50, description="페이지당 항목 수 (최대 50)"),
-        db: Session = Depends(get_db),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정하면 page 는 무시)"),
+        include_total: bool = Query(False, description="cursor 조회 시 total 포함 여부"),
+        fast: bool = Query(False, description="true 면 스키마 검증 없이 바로 직렬화 (응답 형식은 같음)"),
+        accept: Optional[str] = Header(None, include_in_schema=False),
+        db: AsyncSession = Depends(get_async_read_db),
         current_user_id: int = Depends(get_current_user_id)):
 
     offset = (page - 1) * size
-    total_count, result = crud.get_records(db=db, offset=offset, limit=size, current_user_id=current_user_id)
+    # columnar JSON / MessagePack 은 빠른 경로의 dict 를 그대로 변환
+    fmt = negotiate_list_format(accept)
+    fast = fast or fmt != "json"
+    try:
+        total_count, result, next_cursor = await async_crud.get_records(
+            db, offset=offset, limit=size, current_user_id=current_user_id,
+            cursor=cursor, include_total=include_total or not cursor, fast=fast)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return {"total": total_count, "result": result}
+    if fmt != "json":
+        return encoded_response({"total": total_count, "result": result, "next_cursor": next_cursor}, fmt, "/records/")
+    if fast:
+        return ORJSONResponse({"total": total_count, "result": result, "next_cursor": next_cursor})
+
+    return {"total": total_count, "result": result, "next_cursor": next_cursor}
 
 @router.post("/", response_model=APIResponse)
-def create_record(data: RecordCreate,
-                  db: Session = Depends(get_db),
-                  current_user_id: int = Depends(get_current_user_id)):
+async def create_record(data: RecordCreate,
+                        db: AsyncSession = Depends(get_async_write_db),
+                        current_user_id: int = Depends(get_current_user_id)):
 
-    result = crud.create_record(db, data, current_user_id)
+    result = await async_crud.create_record(db, data, current_user_id)
 
     return APIResponse(
         success=True,
         message="Record created successfully",
         data={"record_id": result.id})
 
+@router.get("/stats", response_model=RecordStatsResponse)
+async def get_record_stats(
+        period: str = Query("week", pattern="^(week|month|year)$", description="집계 단위 (week, month, year)"),
+        limit: int = Query(12, ge=1, le=120, description="최근 몇 개 구간을 조회할지"),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user_id: int = Depends(get_current_user_id)):
+
+    result = await async_crud.get_record_stats(db, current_user_id=current_user_id, period=period, limit=limit)
+
+    return {"period": period, "result": result}
+
+@router.post("/batch", response_model=RecordBatchResponse)
+async def create_records_batch(data: RecordBatchCreate,
+                               db: AsyncSession = Depends(get_async_write_db),
+                               current_user_id: int = Depends(get_current_user_id)):
+
+    result = await async_crud.create_records_batch(db, data.items, current_user_id)
+
+    return {"result": result}
+
+# 달력 한 번에 조회할 수 있는 최대 일수
+CALENDAR_MAX_DAYS = 400
+
+@router.get("/calendar", response_model=RecordCalendarResponse)
+async def get_record_calendar(
+        from_date: date = Query(..., alias="from", description="시작일 (YYYY-MM-DD)"),
+        to_date: date = Query(..., alias="to", description="종료일 (YYYY-MM-DD, 포함)"),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user_id: int = Depends(get_current_user_id)):
+
+    if to_date < from_date or (to_date - from_date).days >= CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Invalid date range (up to {CALENDAR_MAX_DAYS} days)")
+
+    calendar = await async_crud.get_record_calendar(
+        db, current_user_id=current_user_id, from_date=from_date, to_date=to_date)
+
+    return {"from_date": from_date, "to_date": to_date, **calendar}
+
 @router.get("/{record_id}", response_model=Place)
-def get_record_detail(
+async def get_record_detail(
         record_id: int,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_read_db),
         current_user_id: int = Depends(get_current_user_id)):
 
-    result = crud.get_record_detail(db, record_id=record_id, current_user_id=current_user_id)
+    result = await async_crud.get_record_detail(db, record_id=record_id, current_user_id=current_user_id)
 
     if result is None:
         raise HTTPException(status_code=404, detail="Place not found")
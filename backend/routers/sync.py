@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from config import settings
+from crud import async_crud
+from schemas.models import SyncResponse
+from db.database import get_async_db
+from dependencies import get_current_user_id
+
+router = APIRouter(
+    prefix="/sync",
+    tags=["sync"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/", response_model=SyncResponse)
+async def get_sync_changes(
+        since: Optional[str] = Query(None, description="이전 응답의 watermark (없으면 전체 데이터)"),
+        limit: int = Query(settings.SYNC_PAGE_SIZE, ge=1, le=1000, description="종류별 최대 항목 수 (최대 1000)"),
+        db: AsyncSession = Depends(get_async_db),
+        current_user_id: int = Depends(get_current_user_id)):
+    """
+    since 이후 바뀐 기록/북마크와 삭제된 항목을 반환한다.
+    앱은 삭제 목록을 먼저 적용한 뒤 records/bookmarks 를 id 기준으로 덮어쓰고, watermark 를 저장한다.
+    has_more 면 저장한 watermark 로 바로 다시 요청하고, full_resync 면 로컬 데이터를 비운 뒤 적용한다.
+    """
+    try:
+        return await async_crud.get_sync_changes(db, current_user_id=current_user_id, since=since, limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid watermark")
@@ -1,15 +1,17 @@
 from fastapi import APIRouter, HTTPException, Depends, Query, FastAPI, Body, status
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from config import settings
-from crud import crud
-from models.db_models import RecordModel, UserModel
+from crud import async_crud
+from models.db_models import RecordModel
 from schemas.models import Place, PlacePagingResponse, RecordPagingResponse, APIResponse, RecordCreate, UserCreate, \
     UserLoginResponse, User, AccessToken, Token
-from db.database import get_db
+from db.database import get_async_db
 from dependencies import get_current_user_id, get_current_user, create_access_token
-import requests
 from util.create_nickname import NicknameGenerator
+from util.metrics import metrics
+from util.password import password_hasher, PasswordHasherBusy
+from util.social_client import social_profile_client, SocialProfileError
+import time
 
 router = APIRouter(
     prefix="/users",
@@ -17,25 +19,32 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+metrics.describe("login_total", "counter", "Login attempts by provider and result")
+metrics.describe("login_duration_seconds", "histogram", "Login handler latency by provider")
 
 @router.post("/", response_model=APIResponse)
-def create_record(data: UserCreate,
-                  db: Session = Depends(get_db)):
+async def create_record(data: UserCreate,
+                        db: AsyncSession = Depends(get_async_db)):
 
-    db_user = crud.get_user_by_email(db, email=data.email)
+    db_user = await async_crud.get_user_by_email(db, email=data.email)
     if db_user:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="email already registered")
 
     nickname_generator = NicknameGenerator()
     random_nickname = nickname_generator.create()
-    exist_nickname = crud.exist_nickname(db, random_nickname)
+    exist_nickname = await async_crud.exist_nickname(db, random_nickname)
     while exist_nickname:
         random_nickname = nickname_generator.create()
-        exist_nickname = crud.exist_nickname(db, random_nickname)
+        exist_nickname = await async_crud.exist_nickname(db, random_nickname)
 
     data.nickname = random_nickname
-    db_user = crud.create_user(db=db, user=data)
+    try:
+        hash_password = await password_hasher.hash(data.password)
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Too many requests, try again later",
+                            headers={"Retry-After": "1"})
+    db_user = await async_crud.create_user(db, user=data, hash_password=hash_password)
 
     return APIResponse(
         success=True,
@@ -45,123 +54,104 @@ def create_record(data: UserCreate,
 @router.post("/login/local", response_model=Token)
 async def login_for_access_token(email: str = Body(..., description="사용자 이메일"),
                                  password: str = Body(..., description="사용자 비밀번호"),
-                                 db: Session = Depends(get_db)):
+                                 db: AsyncSession = Depends(get_async_db)):
 
-    user = crud.get_user_by_email(db, email=email)
-    if not user or not pwd_context.verify(password, user.password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
+    started_at = time.perf_counter()
+    result = "error"
+    try:
+        user = await async_crud.get_user_by_email(db, email=email)
+        try:
+            verified = bool(user and user.password) and await password_hasher.verify(password, user.password)
+        except PasswordHasherBusy:
+            result = "busy"
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                detail="Too many requests, try again later",
+                                headers={"Retry-After": "1"})
+
+        if not verified:
+            result = "failure"
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect email or password",
+            )
+
+        access_token = create_access_token(
+            data={"sub": str(user.id)}, expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-
-    access_token = create_access_token(
-        data={"sub": str(user.id)}, expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-
-    return Token(access_token=access_token, token_type="bearer")
-
-@router.post("/login/kakao", response_model=Token)
-def kakao_login(data: AccessToken, db: Session = Depends(get_db)):
-    headers = {"Authorization": f"Bearer {data.access_token}"}
-    res = requests.get("https://kapi.kakao.com/v2/user/me", headers=headers)
-
-    if res.status_code != 200:
-        raise HTTPException(status_code=400, detail="Invalid Kakao token")
-
-    kakao_user = res.json()
-    provider = 'kakao'
-    provider_user_id = str(kakao_user.get("id"))
-    kakao_account = kakao_user.get("kakao_account", {})
-    email = kakao_account.get("email")
-
-    user = crud.get_social_user(db, provider_user_id, provider)
-
-    if not user:
-        nickname_generator = NicknameGenerator()
-        random_nickname = nickname_generator.create()
-        exist_nickname = crud.exist_nickname(db, random_nickname)
-        while exist_nickname:
-            random_nickname = nickname_generator.create()
-            exist_nickname = crud.exist_nickname(db, random_nickname)
-
-        user = crud.create_social_user(db, email, random_nickname, provider_user_id, provider)
-
-    access_token = create_access_token(
-        data={"sub": str(user.id)}, expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+        result = "success"
+    finally:
+        metrics.inc("login_total", provider="local", result=result)
+        metrics.observe("login_duration_seconds", time.perf_counter() - started_at, provider="local")
 
     return Token(access_token=access_token, token_type="bearer")
 
-@router.post("/login/naver", response_model=Token)
-def naver_login(data: AccessToken, db: Session = Depends(get_db)):
-    headers = {"Authorization": f"Bearer {data.access_token}"}
+async def _social_login(db: AsyncSession, provider: str, access_token: str, parse_profile) -> Token:
+    started_at = time.perf_counter()
+    result = "error"
     try:
-        res = requests.get("https://openapi.naver.com/v1/nid/me", headers=headers)
-        res.raise_for_status()  # 200 OK가 아니면 예외 발생
-
-        naver_user = res.json().get('response', {})
-        if not naver_user:
-            raise HTTPException(status_code=400, detail="Invalid Naver token or empty response")
-
-    except requests.exceptions.RequestException as e:
-        raise HTTPException(status_code=400, detail=f"Failed to get user info from Naver: {e}")
-
-    provider = 'naver'
-    provider_user_id = str(naver_user.get("id"))
-    email = naver_user.get("email")
-
-    user = crud.get_social_user(db, provider_user_id, provider)
-
-    if not user:
-        nickname_generator = NicknameGenerator()
-        random_nickname = nickname_generator.create()
-        exist_nickname = crud.exist_nickname(db, random_nickname)
-        while exist_nickname:
+        try:
+            profile = await social_profile_client.fetch_profile(provider, access_token)
+        except SocialProfileError as e:
+            if e.invalid_token:
+                result = "failure"
+                raise HTTPException(status_code=400, detail=f"Invalid {provider.capitalize()} token")
+            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY,
+                                detail=f"Failed to get user info from {provider.capitalize()}: {e.detail}")
+
+        provider_user_id, email = parse_profile(profile)
+        if not provider_user_id:
+            result = "failure"
+            raise HTTPException(status_code=400,
+                                detail=f"Invalid {provider.capitalize()} token or empty response")
+
+        user = await async_crud.get_social_user(db, provider_user_id, provider)
+
+        if not user:
+            nickname_generator = NicknameGenerator()
             random_nickname = nickname_generator.create()
-            exist_nickname = crud.exist_nickname(db, random_nickname)
+            exist_nickname = await async_crud.exist_nickname(db, random_nickname)
+            while exist_nickname:
+                random_nickname = nickname_generator.create()
+                exist_nickname = await async_crud.exist_nickname(db, random_nickname)
 
-        user = crud.create_social_user(db, email, random_nickname, provider_user_id, provider)
+            user = await async_crud.create_social_user(db, email, random_nickname, provider_user_id, provider)
 
-    access_token = create_access_token(
-        data={"sub": str(user.id)},
-        expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+        access_token = create_access_token(
+            data={"sub": str(user.id)},
+            expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+        result = "success"
+    finally:
+        metrics.inc("login_total", provider=provider, result=result)
+        metrics.observe("login_duration_seconds", time.perf_counter() - started_at, provider=provider)
 
     return Token(access_token=access_token, token_type="bearer")
 
+def _parse_kakao_profile(kakao_user: dict):
+    kakao_account = kakao_user.get("kakao_account", {})
+    provider_user_id = str(kakao_user["id"]) if kakao_user.get("id") is not None else None
+    return provider_user_id, kakao_account.get("email")
 
-@router.post("/login/google", response_model=Token)
-async def google_login(data: AccessToken, db: Session = Depends(get_db)):
-    headers = {"Authorization": f"Bearer {data.access_token}"}
-    res = requests.get("https://www.googleapis.com/oauth2/v2/userinfo", headers=headers)
-
-    if res.status_code != 200:
-        raise HTTPException(status_code=400, detail="Invalid Google token")
-
-    google_user = res.json()
-    provider = 'google'
-    provider_user_id = google_user.get("id")
-    email = google_user.get("email")
-
-    user = crud.get_social_user(db, provider_user_id, provider)
+def _parse_naver_profile(profile: dict):
+    naver_user = profile.get("response", {})
+    provider_user_id = str(naver_user["id"]) if naver_user.get("id") is not None else None
+    return provider_user_id, naver_user.get("email")
 
-    if not user:
-        nickname_generator = NicknameGenerator()
-        random_nickname = nickname_generator.create()
-        exist_nickname = crud.exist_nickname(db, random_nickname)
-        while exist_nickname:
-            random_nickname = nickname_generator.create()
-            exist_nickname = crud.exist_nickname(db, random_nickname)
+def _parse_google_profile(google_user: dict):
+    return google_user.get("id"), google_user.get("email")
 
-        user = crud.create_social_user(db, email, random_nickname, provider_user_id, provider)
+@router.post("/login/kakao", response_model=Token)
+async def kakao_login(data: AccessToken, db: AsyncSession = Depends(get_async_db)):
+    return await _social_login(db, "kakao", data.access_token, _parse_kakao_profile)
 
-    access_token = create_access_token(
-        data={"sub": str(user.id)},
-        expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+@router.post("/login/naver", response_model=Token)
+async def naver_login(data: AccessToken, db: AsyncSession = Depends(get_async_db)):
+    return await _social_login(db, "naver", data.access_token, _parse_naver_profile)
 
-    return Token(access_token=access_token, token_type="bearer")
+@router.post("/login/google", response_model=Token)
+async def google_login(data: AccessToken, db: AsyncSession = Depends(get_async_db)):
+    return await _social_login(db, "google", data.access_token, _parse_google_profile)
 
 @router.get("/me", response_model=UserLoginResponse)
-async def read_users_me(current_user: UserModel = Depends(get_current_user)):
+async def read_users_me(current_user: UserLoginResponse = Depends(get_current_user)):
     return current_user
@@ -30,8 +30,35 @@ class PlaceUpdate(BaseModel):
     image_url: Optional[str] = None
 
 class PlacePagingResponse(BaseModel):
-    total: int
+    total: Optional[int] = None  # cursor 조회에서 include_total=false 면 생략
     result: List[Place]
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
+
+class NearbyPlace(Place):
+    distance: float  # 기준 좌표로부터의 거리 (미터)
+
+class PlaceNearbyResponse(BaseModel):
+    total: int
+    result: List[NearbyPlace]
+
+class PlaceSuggestion(BaseModel):
+    id: int
+    name: str
+
+class PlaceCluster(BaseModel):
+    latitude: float  # 클러스터에 속한 장소들의 중심 좌표
+    longitude: float
+    count: int
+    place_id: Optional[int] = None  # 장소가 하나뿐인 경우의 장소 id
+
+    class Config:
+        from_attributes = True
+
+class PlaceViewportResponse(BaseModel):
+    zoom: int
+    clustered: bool
+    places: List[Place] = []
+    clusters: List[PlaceCluster] = []
 
 class BookmarkBase(BaseModel):
     id: int
@@ -51,9 +78,24 @@ class Bookmark(BaseModel):
 class BookmarkCreate(BaseModel):
     place_id: int
 
+class BookmarkBatchUpdate(BaseModel):
+    add: List[int] = Field([], max_length=500)  # 북마크할 장소 id
+    remove: List[int] = Field([], max_length=500)  # 북마크 해제할 장소 id
+
+class BookmarkBatchResponse(BaseModel):
+    added: List[int]  # 현재 북마크된 상태인 추가 요청 장소 id (없는 장소는 제외)
+    removed: List[int]  # 실제로 해제된 장소 id
+
+class BookmarkIdsResponse(BaseModel):
+    format: str
+    count: int
+    place_ids: Optional[List[int]] = None  # format=array
+    bitmap: Optional[str] = None  # format=bitmap: place_id 번째 비트가 1 인 비트맵의 base64 (util/bitmap.py)
+
 class BookmarkPagingResponse(BaseModel):
-    total: int
+    total: Optional[int] = None  # cursor 조회에서 include_total=false 면 생략
     result: List[Bookmark]
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
 
 class Record(BaseModel):
     id: int
@@ -81,9 +123,73 @@ class RecordCreate(BaseModel):
     swim_distance: int = 0
     memo: str = ''
 
+class RecordBatchItem(RecordCreate):
+    client_id: str = Field(..., min_length=1, max_length=64)  # 앱에서 만든 멱등성 키
+
+class RecordBatchCreate(BaseModel):
+    items: List[RecordBatchItem] = Field(..., min_length=1, max_length=100)
+
+class RecordBatchResult(BaseModel):
+    client_id: str
+    status: str  # 'created', 'duplicate', 'invalid'
+    record_id: Optional[int] = None
+
+class RecordBatchResponse(BaseModel):
+    result: List[RecordBatchResult]
+
 class RecordPagingResponse(BaseModel):
-    total: int
+    total: Optional[int] = None  # cursor 조회에서 include_total=false 면 생략
     result: List[Record]
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
+
+class RecordPoolStats(BaseModel):
+    place_id: int
+    place_name: str
+    distance: int
+    duration_seconds: int
+    session_count: int
+
+class RecordPeriodStats(BaseModel):
+    period_start: date
+    distance: int
+    duration_seconds: int
+    session_count: int
+    pace_seconds_per_100m: Optional[float] = None  # 거리가 0 이면 None
+    pools: List[RecordPoolStats]
+
+class RecordStatsResponse(BaseModel):
+    period: str
+    result: List[RecordPeriodStats]
+
+class RecordCalendarResponse(BaseModel):
+    # 날짜별 값을 같은 인덱스의 배열로 나눠 담은 열(column) 형식
+    from_date: date
+    to_date: date
+    dates: List[date]
+    distance: List[int]
+    session_count: List[int]
+    place_ids: List[List[int]]
+
+class SyncResponse(BaseModel):
+    watermark: str  # 다음 동기화 요청의 since 로 그대로 보냄
+    has_more: bool  # True 면 watermark 로 바로 이어서 요청 (남은 변경분이 있음)
+    full_resync: bool  # True 면 since 가 너무 오래되어 전체를 다시 보냄. 앱은 로컬 데이터를 비우고 적용
+    records: List[Record]
+    bookmarks: List[Bookmark]
+    deleted_record_ids: List[int]
+    deleted_bookmark_place_ids: List[int]
+
+class SlowQuery(BaseModel):
+    logged_at: datetime
+    duration_ms: float
+    caller: Optional[str] = None  # 호출한 crud 함수 (함수명:줄번호)
+    statement: str
+    parameters: str
+    explain: Optional[List[str]] = None  # 샘플링된 경우의 실행 계획
+
+class SlowQueryLogResponse(BaseModel):
+    threshold_ms: float
+    result: List[SlowQuery]
 
 class User(BaseModel):
     id: int
@@ -107,6 +213,9 @@ class UserLoginResponse(BaseModel):
     profile_image: Optional[str] = None
     provider: Optional[str] = None
 
+    class Config:
+        from_attributes = True
+
 class UserCreate(BaseModel):
     nickname: Optional[str] = None
     email: EmailStr
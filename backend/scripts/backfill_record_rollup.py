@@ -0,0 +1,32 @@
+"""
+기존 수영 기록으로 record_rollup(주/월/년 통계 합계)을 다시 만든다.
+테이블을 처음 만들었을 때나 기록을 직접 수정한 뒤 한 번 실행한다.
+"""
+import os
+import sys
+import time
+
+# --- 프로젝트 경로 설정 ---
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+# -------------------------
+
+from db.database import SessionLocal, engine
+from models.db_models import Base
+from crud import crud
+
+
+if __name__ == "__main__":
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        started_at = time.perf_counter()
+        count = crud.rebuild_record_rollups(db)
+        print(f"통계 합계 {count}개를 다시 생성했습니다. ({time.perf_counter() - started_at:.2f}s)")
+    except Exception as e:
+        print(f"통계 합계 생성 중 오류가 발생했습니다: {e}")
+        db.rollback()
+    finally:
+        db.close()
@@ -1,6 +1,10 @@
-import json
 import os
 import sys
+import time
+from typing import Iterator, List
+
+import ijson
+import numpy as np
 from sqlalchemy.orm import Session
 from pyproj import Transformer
 
@@ -12,38 +16,46 @@ if project_root not in sys.path:
 # -------------------------
 
 from db.database import SessionLocal, engine
-from models.db_models import PlaceModel, Base
+from models.db_models import Base
+from crud import crud
+from util.geo import encode_geohash
 
 # EPSG:2097 → EPSG:4326 변환기 (X=경도, Y=위도 순서 주의)
 transformer = Transformer.from_crs("EPSG:2097", "EPSG:4326", always_xy=True)
 
-def load_places_from_json(db: Session, json_path: str):
-    """
-    jonghab.json 파일을 읽어 '영업/정상' 상태인 장소 데이터를
-    데이터베이스에 저장합니다.
-    - 이미 존재하는 데이터는 건너뜁니다.
-    - 필수 정보(도로명주소, 좌표)가 없거나 유효하지 않으면 건너뜁니다.
-    """
-    print(f"Attempting to load JSON file from: {json_path}")
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"오류: {json_path} 에서 파일을 찾을 수 없습니다.")
-        return
-    except json.JSONDecodeError:
-        print(f"오류: {json_path} 파일의 JSON 형식이 올바르지 않습니다.")
-        return
+# 한 번의 INSERT ... ON DUPLICATE KEY UPDATE 로 보내는 행 수
+BATCH_SIZE = 1000
 
-    # 성능 향상을 위해 기존 데이터를 메모리에 세트로 로드
-    print("기존 장소 데이터를 로드하여 중복을 확인합니다...")
-    existing_places = {(p.name, p.address) for p in db.query(PlaceModel.name, PlaceModel.address).all()}
-    print(f"현재 데이터베이스에 {len(existing_places)}개의 장소가 있습니다.")
+# 인자가 없을 때 적재하는 프로젝트 기본 데이터
+DEFAULT_JSON_PATHS = [
+    os.path.join(project_root, 'scripts/jonghab.json'),
+    os.path.join(project_root, 'scripts/seoul.json'),
+]
 
-    places_to_add = []
-    records = data.get("DATA", [])
 
-    print(f"JSON 파일에서 {len(records)}개의 레코드를 발견했습니다. 데이터 처리를 시작합니다...")
+def iter_records(json_path: str) -> Iterator[dict]:
+    """JSON 파일 전체를 메모리에 올리지 않고 DATA 배열의 레코드를 하나씩 읽는다."""
+    with open(json_path, 'rb') as f:
+        yield from ijson.items(f, 'DATA.item')
+
+
+def iter_batches(records: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_place_rows(records: List[dict]) -> List[dict]:
+    """
+    레코드 묶음에서 '영업/정상' 상태이고 필수 정보가 있는 장소만 골라
+    좌표를 한 번에(NumPy 배열) 변환한 뒤 place 테이블 행으로 만든다.
+    """
+    names, addresses, xs, ys = [], [], [], []
 
     for record in records:
         # 1. '영업/정상' 상태인 데이터만 필터링
@@ -60,70 +72,118 @@ def load_places_from_json(db: Session, json_path: str):
         if not all([name, address, x_str, y_str]):
             continue
 
-        # 4. 데이터 타입 변환 및 정리
         try:
-            x_pos = str(x_str.strip())
-            y_pos = str(y_str.strip())
-
-            x, y = transformer.transform(x_pos, y_pos)
+            x = float(x_str.strip())
+            y = float(y_str.strip())
         except (ValueError, AttributeError):
-            # 변환 실패 시 해당 레코드 건너뛰기
-            print(f"좌표 변환 실패로 레코드를 건너뜁니다: name='{name}'")
+            print(f"좌표 형식 오류로 레코드를 건너뜁니다: name='{name}'")
             continue
 
-        # 5. 중복 데이터 확인
-        if (name, address) in existing_places:
+        names.append(name)
+        addresses.append(address)
+        xs.append(x)
+        ys.append(y)
+
+    if not names:
+        return []
+
+    # 4. 묶음 전체 좌표를 한 번에 변환
+    lngs, lats = transformer.transform(np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))
+
+    rows = {}
+    for name, address, lng, lat in zip(names, addresses, lngs.tolist(), lats.tolist()):
+        if not (np.isfinite(lng) and np.isfinite(lat)):
+            print(f"좌표 변환 실패로 레코드를 건너뜁니다: name='{name}'")
             continue
 
-        # 6. Place 객체 생성 및 리스트에 추가
-        new_place = PlaceModel(
-            name=name,
-            address=address,
-            x_position=x,
-            y_position=y,
-            image_url=''
-        )
-        places_to_add.append(new_place)
-        existing_places.add((name, address))  # 현재 세션 내 중복 방지
-
-    if not places_to_add:
-        print("추가할 새로운 장소 데이터가 없습니다.")
-        return
+        # 같은 묶음 안의 중복 (name, address) 는 마지막 값만 사용
+        rows[(name, address)] = {
+            "name": name,
+            "address": address,
+            "x_position": str(lng),
+            "y_position": str(lat),
+            "latitude": lat,
+            "longitude": lng,
+            "geohash": encode_geohash(lat, lng),
+            "image_url": '',
+            "is_deleted": False,
+            "deleted_at": None,
+        }
 
-    print(f"데이터베이스에 {len(places_to_add)}개의 새로운 장소를 추가합니다...")
-    # 여러 객체를 한 번에 저장하여 성능 최적화
-    db.bulk_save_objects(places_to_add)
-    db.commit()
-    print("성공적으로 데이터베이스에 커밋했습니다.")
+    return list(rows.values())
 
 
-if __name__ == "__main__":
-    # JSON 파일 경로 설정 (프로젝트 루트 기준)
-    json_file_path = os.path.join(project_root, 'scripts/jonghab.json')
+def load_places_from_json(db: Session, json_path: str, batch_size: int = BATCH_SIZE):
+    """
+    jonghab.json 형식의 파일을 스트리밍으로 읽어 '영업/정상' 상태인 장소 데이터를
+    데이터베이스에 저장합니다.
+    - (name, address) 가 이미 있으면 좌표를 갱신합니다 (upsert).
+    - 필수 정보(도로명주소, 좌표)가 없거나 유효하지 않으면 건너뜁니다.
+    """
+    print(f"Attempting to load JSON file from: {json_path}")
+    if not os.path.exists(json_path):
+        print(f"오류: {json_path} 에서 파일을 찾을 수 없습니다.")
+        return
 
-    # 데이터베이스 테이블이 없으면 생성
-    print("데이터베이스 테이블을 확인하고 필요시 생성합니다...")
-    Base.metadata.create_all(bind=engine)
+    started_at = time.perf_counter()
+    read_count = 0
+    written_count = 0
 
-    # 데이터베이스 세션 생성
-    db = SessionLocal()
     try:
-        load_places_from_json(db, json_file_path)
-    except Exception as e:
-        print(f"예상치 못한 오류가 발생했습니다: {e}")
+        for batch in iter_batches(iter_records(json_path), batch_size):
+            read_count += len(batch)
+            written_count += crud.upsert_places(db, build_place_rows(batch))
+            db.commit()
+
+            elapsed = time.perf_counter() - started_at
+            print(f"  {read_count}개 레코드 처리, {written_count}개 장소 저장 "
+                  f"({read_count / elapsed:.0f} records/s, {written_count / elapsed:.0f} rows/s)")
+    except ijson.JSONError:
+        print(f"오류: {json_path} 파일의 JSON 형식이 올바르지 않습니다.")
         db.rollback()
-    finally:
-        db.close()
-        print("데이터베이스 세션을 닫았습니다.")
+        return
+
+    elapsed = time.perf_counter() - started_at
+    print(f"{json_path}: {read_count}개 레코드 중 {written_count}개 장소를 저장했습니다. ({elapsed:.2f}s)")
+
 
-    json_file_path = os.path.join(project_root, 'scripts/seoul.json')
-    # 데이터베이스 세션 생성
+def refresh_place_indexes():
+    """장소 데이터가 바뀐 뒤 지도 클러스터와 검색 색인을 다시 만들고 데이터 버전을 올린다."""
     db = SessionLocal()
     try:
-        load_places_from_json(db, json_file_path)
+        cluster_count = crud.rebuild_place_clusters(db)
+        print(f"지도 클러스터 {cluster_count}개를 다시 생성했습니다.")
+        gram_count = crud.rebuild_place_search_index(db)
+        print(f"검색 색인 n-gram {gram_count}개를 다시 생성했습니다.")
+        # 실행 중인 서버들이 인메모리 인덱스(자동완성 등)를 다시 만들도록 버전을 올림
+        version = crud.bump_data_version(db, "place")
+        print(f"장소 데이터 버전을 {version}(으)로 올렸습니다.")
     except Exception as e:
-        print(f"예상치 못한 오류가 발생했습니다: {e}")
+        print(f"클러스터/검색 색인 생성 중 오류가 발생했습니다: {e}")
         db.rollback()
     finally:
         db.close()
-        print("데이터베이스 세션을 닫았습니다.")
+
+
+if __name__ == "__main__":
+    # JSON 파일 경로 설정 (인자가 없으면 프로젝트 기본 데이터 사용)
+    json_file_paths = sys.argv[1:] or DEFAULT_JSON_PATHS
+
+    # 데이터베이스 테이블이 없으면 생성
+    print("데이터베이스 테이블을 확인하고 필요시 생성합니다...")
+    Base.metadata.create_all(bind=engine)
+
+    for json_file_path in json_file_paths:
+        # 데이터베이스 세션 생성
+        db = SessionLocal()
+        try:
+            load_places_from_json(db, json_file_path)
+        except Exception as e:
+            print(f"예상치 못한 오류가 발생했습니다: {e}")
+            db.rollback()
+        finally:
+            db.close()
+            print("데이터베이스 세션을 닫았습니다.")
+
+    # 장소 데이터가 바뀌었으므로 지도 클러스터와 검색 색인을 다시 계산
+    refresh_place_indexes()
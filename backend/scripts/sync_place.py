@@ -0,0 +1,236 @@
+"""
+장소 증분 동기화
+
+load_place.py 가 파일 전체를 다시 upsert 하는 것과 달리, 원천 레코드마다 정규화한 필드의 해시(fingerprint)를
+저장해 두고 다시 실행할 때는 바뀐 레코드만 반영한다.
+- 새 레코드: 영업 중이면 추가
+- 바뀐 레코드: 영업 중이면 갱신, 폐업/휴업 등이면 숨김(is_deleted)
+- 원천에서 사라진 레코드: 실행이 끝날 때 숨김
+묶음마다 변경분과 진행 위치(place_sync_run.position)를 한 트랜잭션으로 커밋하므로,
+중간에 중단되어도 다시 실행하면 마지막 체크포인트부터 이어서 진행한다.
+"""
+import hashlib
+import itertools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import ijson
+import numpy as np
+from sqlalchemy.orm import Session
+
+# --- 프로젝트 경로 설정 ---
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+# -------------------------
+
+from db.database import SessionLocal, engine
+from models.db_models import Base, PlaceSyncRunModel
+from crud import crud
+from util.geo import encode_geohash
+from scripts.load_place import transformer, iter_records, iter_batches, refresh_place_indexes, \
+    BATCH_SIZE, DEFAULT_JSON_PATHS
+
+ACTIVE_STATE = "영업/정상"
+
+
+def source_name(json_path: str) -> str:
+    # 원천 이름은 파일 이름 (예: scripts/jonghab.json → jonghab)
+    return os.path.splitext(os.path.basename(json_path))[0]
+
+
+def normalize_record(record: dict) -> Optional[dict]:
+    """
+    원천 레코드에서 장소에 쓰는 필드만 정규화해 fingerprint 를 계산한다.
+    관리번호(mgtno)는 자치단체마다 겹치므로 개방자치단체코드와 묶어 키로 사용.
+    """
+    mgtno = (record.get("mgtno") or "").strip()
+    if not mgtno:
+        return None
+
+    name = record.get("bplcnm") or ""
+    address = record.get("rdnwhladdr") or ""
+    x_str = (record.get("x") or "").strip()
+    y_str = (record.get("y") or "").strip()
+    state = (record.get("trdstatenm") or "").strip()
+
+    fields = [name.strip(), address.strip(), x_str, y_str, state]
+    fingerprint = hashlib.sha1(json.dumps(fields, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    try:
+        x, y = float(x_str), float(y_str)
+    except ValueError:
+        x = y = None
+
+    return {
+        "source_id": f"{(record.get('opnsfteamcode') or '').strip()}-{mgtno}",
+        "fingerprint": fingerprint,
+        "active": state == ACTIVE_STATE and bool(name and address) and x is not None,
+        "name": name,
+        "address": address,
+        "x": x,
+        "y": y,
+    }
+
+
+def transform_entries(entries: List[dict]):
+    # 바뀐 영업 레코드의 좌표만 한 번에 변환. 변환에 실패하면 지도에 표시할 수 없으므로 숨김 대상으로 돌린다.
+    if not entries:
+        return
+
+    xs = np.asarray([entry["x"] for entry in entries], dtype=np.float64)
+    ys = np.asarray([entry["y"] for entry in entries], dtype=np.float64)
+    lngs, lats = transformer.transform(xs, ys)
+
+    for entry, lng, lat in zip(entries, lngs.tolist(), lats.tolist()):
+        if np.isfinite(lng) and np.isfinite(lat):
+            entry["longitude"], entry["latitude"] = lng, lat
+        else:
+            print(f"좌표 변환 실패로 레코드를 숨김 처리합니다: name='{entry['name']}'")
+            entry["active"] = False
+
+
+def sync_batch(db: Session, run: PlaceSyncRunModel, records: List[dict], position: int) -> int:
+    """한 묶음을 기존 데이터와 비교해 변경분만 반영한다. 건너뛴(다른 장소와 이름/주소가 겹치는) 레코드 수를 반환."""
+    # 같은 묶음 안의 중복 source_id 는 마지막 값만 사용
+    entries = {}
+    for record in records:
+        entry = normalize_record(record)
+        if entry is not None:
+            entries[entry["source_id"]] = entry
+
+    # 1. fingerprint 가 같고 노출 상태도 그대로인 레코드는 건너뜀
+    state = crud.get_place_sync_state(db, run.source, list(entries))
+    changed = []
+    for source_id, entry in entries.items():
+        current = state.get(source_id)
+        if current is None and not entry["active"]:
+            continue  # 저장된 적 없는 폐업 레코드
+        if current is not None and current[1] == entry["fingerprint"] and current[2] != entry["active"]:
+            run.unchanged += 1
+            continue
+        changed.append(entry)
+
+    transform_entries([entry for entry in changed if entry["active"]])
+
+    # 2. 추가/갱신할 장소의 (name, address) 가 이미 있는지 확인
+    #    원천 정보가 없는 장소(load_place.py 로 적재)는 이번 원천으로 연결하고, 다른 원천의 장소와 겹치면 건너뜀
+    owners = crud.get_place_owners(db, [(entry["name"], entry["address"]) for entry in changed if entry["active"]])
+    now = datetime.now()
+    inserts, updates, used_keys = [], [], set()
+    skipped = 0
+
+    for entry in changed:
+        current = state.get(entry["source_id"])
+        place_id = current[0] if current is not None else None
+
+        if not entry["active"]:
+            # 폐업/휴업 등: 보이는 장소면 숨기고, 이미 숨긴 장소면 fingerprint 만 갱신
+            if current is None:
+                continue
+            update = {"id": place_id, "fingerprint": entry["fingerprint"]}
+            if not current[2]:
+                update.update(is_deleted=True, deleted_at=now)
+                run.deleted += 1
+            updates.append(update)
+            continue
+
+        key = (entry["name"], entry["address"])
+        owner = owners.get(key)
+        if key in used_keys or (owner is not None and owner[0] != place_id and
+                                (place_id is not None or owner[1] is not None)):
+            skipped += 1
+            continue
+        used_keys.add(key)
+
+        lat, lng = entry["latitude"], entry["longitude"]
+        row = {
+            "source": run.source,
+            "source_id": entry["source_id"],
+            "fingerprint": entry["fingerprint"],
+            "name": entry["name"],
+            "address": entry["address"],
+            "x_position": str(lng),
+            "y_position": str(lat),
+            "latitude": lat,
+            "longitude": lng,
+            "geohash": encode_geohash(lat, lng),
+            "is_deleted": False,
+            "deleted_at": None,
+        }
+
+        if place_id is None and owner is None:
+            row.update(image_url='', sync_run_id=run.id)
+            inserts.append(row)
+            run.inserted += 1
+        else:
+            row["id"] = place_id if place_id is not None else owner[0]
+            updates.append(row)
+            run.updated += 1
+
+    crud.apply_place_sync_batch(db, run, inserts, updates, list(entries), position)
+    return skipped
+
+
+def sync_places_from_json(db: Session, json_path: str, batch_size: int = BATCH_SIZE) -> bool:
+    """파일 하나를 증분 동기화한다. 장소 데이터가 바뀌었으면 True 를 반환."""
+    print(f"Attempting to sync JSON file from: {json_path}")
+    if not os.path.exists(json_path):
+        print(f"오류: {json_path} 에서 파일을 찾을 수 없습니다.")
+        return False
+
+    run = crud.get_place_sync_run(db, source_name(json_path))
+    position = run.position
+    records = iter_records(json_path)
+    if position:
+        # 중단된 실행: 체크포인트까지 반영된 레코드는 읽기만 하고 건너뜀
+        print(f"  실행 #{run.id} 를 {position}번째 레코드부터 이어서 진행합니다.")
+        records = itertools.islice(records, position, None)
+
+    started_at = time.perf_counter()
+    skipped = 0
+
+    try:
+        for batch in iter_batches(records, batch_size):
+            position += len(batch)
+            skipped += sync_batch(db, run, batch, position)
+    except ijson.JSONError:
+        print(f"오류: {json_path} 파일의 JSON 형식이 올바르지 않습니다. (실행 #{run.id} 은 {run.position}번째 레코드까지 반영됨)")
+        db.rollback()
+        return False
+
+    crud.finish_place_sync_run(db, run)
+
+    elapsed = time.perf_counter() - started_at
+    print(f"{json_path}: 추가 {run.inserted}, 갱신 {run.updated}, 숨김 {run.deleted}, "
+          f"변경 없음 {run.unchanged}, 중복으로 건너뜀 {skipped} ({elapsed:.2f}s)")
+
+    return bool(run.inserted or run.updated or run.deleted)
+
+
+if __name__ == "__main__":
+    json_file_paths = sys.argv[1:] or DEFAULT_JSON_PATHS
+
+    print("데이터베이스 테이블을 확인하고 필요시 생성합니다...")
+    Base.metadata.create_all(bind=engine)
+
+    changed = False
+    for json_file_path in json_file_paths:
+        db = SessionLocal()
+        try:
+            changed = sync_places_from_json(db, json_file_path) or changed
+        except Exception as e:
+            print(f"예상치 못한 오류가 발생했습니다: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    # 바뀐 장소가 있을 때만 지도 클러스터와 검색 색인을 다시 계산
+    if changed:
+        refresh_place_indexes()
+    else:
+        print("바뀐 장소가 없어 클러스터/검색 색인을 그대로 둡니다.")
@@ -0,0 +1,20 @@
+import base64
+from typing import Iterable, List
+
+
+def encode_id_bitmap(ids: Iterable[int]) -> str:
+    """양의 정수 id 목록을 비트맵(id 번째 비트가 1, 바이트 안에서는 낮은 비트부터)의 base64 문자열로 변환"""
+    ids = list(ids)
+    if not ids:
+        return ""
+
+    bitmap = bytearray(max(ids) // 8 + 1)
+    for id_ in ids:
+        bitmap[id_ // 8] |= 1 << (id_ % 8)
+
+    return base64.b64encode(bytes(bitmap)).decode("ascii")
+
+
+def decode_id_bitmap(value: str) -> List[int]:
+    bitmap = base64.b64decode(value)
+    return [i * 8 + bit for i, byte in enumerate(bitmap) for bit in range(8) if byte & (1 << bit)]
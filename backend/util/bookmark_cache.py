@@ -0,0 +1,131 @@
+import threading
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from config import settings
+from util.cache import TTLCache
+from util.metrics import metrics
+
+metrics.describe("bookmark_cache_lookups_total", "counter", "Bookmark id set lookups by result (hit, miss, error)")
+
+# Redis 집합에 항상 넣어 두는 표시용 멤버 (장소 id 는 1 부터 시작).
+# 북마크가 없는 유저도 빈 집합이 캐시된 것(히트)과 키가 없는 것(미스)을 구분하기 위해 쓴다.
+_LOADED_MARKER = "0"
+
+
+class BookmarkSetCache:
+    """
+    유저별 북마크한 장소 id 집합 캐시. 장소 목록/상세의 is_bookmark 를 북마크 테이블 조인 없이 채우는 데 쓴다.
+    기본은 프로세스 안의 LRU + TTL 캐시이고, redis_client 를 주면 여러 서버 프로세스가 공유하는
+    Redis 호환 서버의 집합(SET)을 사용한다. Redis 오류는 캐시 미스로 처리해 DB 조회로 넘어간다.
+    메서드는 모두 코루틴이다. 조회는 AsyncSession.run_sync 에 들어가기 전에 이벤트 루프에서 await 하므로
+    (crud/async_crud.py) 느린 Redis 가 루프를 막지 않는다. redis_client 는 redis.asyncio 클라이언트.
+
+    캐시된 집합은 고쳐 쓰지 않는다. 북마크가 바뀌면 invalidate 로 지우고 유저별 버전을 올리며,
+    set 은 DB 에서 읽기 전에 받은 버전이 그대로일 때만 저장한다. 그래서 읽는 사이에 쓰기가 끝난
+    조회가 예전 집합을 다시 캐시하지 못한다.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 300, redis_client=None, key_prefix: str = "bookmarks:"):
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self._redis = redis_client
+        if redis_client is None:
+            self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+            # 버전이 만료되면 0 으로 돌아가지만, 그보다 먼저 받은 버전으로 set 하는 조회는 없다고 본다 (TTL 이상 걸리는 조회)
+            self._versions = TTLCache(maxsize=maxsize, ttl=ttl)
+            self._lock = threading.Lock()
+        else:
+            from redis.exceptions import RedisError, WatchError
+            self._redis_errors = (RedisError, OSError)
+            self._watch_error = WatchError
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    def _version_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}version:{user_id}"
+
+    async def get(self, user_id: int) -> Tuple[Optional[FrozenSet[int]], int]:
+        """(캐시된 장소 id 집합 또는 None, 현재 버전). 미스면 이 버전을 set 에 그대로 넘긴다."""
+        if self._redis is None:
+            with self._lock:
+                place_ids, version = self._local.get(user_id), self._versions.get(user_id, 0)
+        else:
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.smembers(self._key(user_id))
+                pipe.get(self._version_key(user_id))
+                members, version = await pipe.execute()
+            except self._redis_errors:
+                metrics.inc("bookmark_cache_lookups_total", result="error")
+                return None, -1
+            version = int(version or 0)
+            members = {member.decode() if isinstance(member, bytes) else member for member in members}
+            place_ids = frozenset(int(member) for member in members if member != _LOADED_MARKER) \
+                if _LOADED_MARKER in members else None
+
+        metrics.inc("bookmark_cache_lookups_total", result="hit" if place_ids is not None else "miss")
+        return place_ids, version
+
+    async def set(self, user_id: int, place_ids: Iterable[int], version: int):
+        """get 에서 받은 version 이 아직 현재 버전일 때만 저장 (그 사이 invalidate 됐으면 버림)"""
+        place_ids = frozenset(place_ids)
+        if self._redis is None:
+            with self._lock:
+                if self._versions.get(user_id, 0) == version:
+                    self._local.set(user_id, place_ids)
+            return
+
+        if version < 0:
+            return  # 버전을 읽지 못한 조회 (Redis 오류)
+
+        key, version_key = self._key(user_id), self._version_key(user_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                await pipe.watch(version_key)
+                if int(await pipe.get(version_key) or 0) != version:
+                    return
+                pipe.multi()
+                pipe.delete(key)
+                pipe.sadd(key, _LOADED_MARKER, *place_ids)
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except self._watch_error:
+            pass  # 저장하는 사이에 invalidate 됨
+        except self._redis_errors:
+            metrics.inc("bookmark_cache_lookups_total", result="error")
+
+    async def invalidate(self, user_id: int):
+        """북마크를 바꾼 뒤(커밋 후) 호출. 캐시를 지우고 버전을 올려 진행 중인 조회의 set 을 막는다."""
+        if self._redis is None:
+            with self._lock:
+                self._local.invalidate(user_id)
+                self._versions.set(user_id, self._versions.get(user_id, 0) + 1)
+            return
+
+        version_key = self._version_key(user_id)
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.incr(version_key)
+            pipe.expire(version_key, self.ttl)
+            pipe.delete(self._key(user_id))
+            await pipe.execute()
+        except self._redis_errors:
+            # 지우지 못한 값은 TTL 이 지나면 사라짐
+            metrics.inc("bookmark_cache_lookups_total", result="error")
+
+
+def _create_bookmark_cache() -> BookmarkSetCache:
+    redis_client = None
+    if settings.BOOKMARK_CACHE_REDIS_URL:
+        # Redis 를 쓸 때만 필요한 의존성
+        import redis.asyncio
+        redis_client = redis.asyncio.Redis.from_url(settings.BOOKMARK_CACHE_REDIS_URL,
+                                            socket_timeout=settings.BOOKMARK_CACHE_REDIS_TIMEOUT)
+
+    return BookmarkSetCache(maxsize=settings.BOOKMARK_CACHE_SIZE,
+                            ttl=settings.BOOKMARK_CACHE_TTL,
+                            redis_client=redis_client)
+
+
+bookmark_cache = _create_bookmark_cache()
@@ -0,0 +1,118 @@
+import gzip
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from util.metrics import metrics, route_label
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 사용
+    brotli = None
+
+metrics.describe("response_body_bytes_total", "counter", "Response body bytes sent by endpoint and content encoding")
+metrics.describe("response_bytes_saved_total", "counter",
+                 "Bytes saved by endpoint and method (gzip, br: compression / columnar, msgpack: compact encoding)")
+
+# 압축해도 효과가 있는 본문 형식
+COMPRESSIBLE_TYPES = ("application/json", "application/vnd.surine.columnar+json", "application/msgpack", "text/")
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding 에서 사용할 압축 방식 (br 우선, 다음 gzip). q=0 인 방식은 제외."""
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+
+    return None
+
+
+class CompressionMiddleware:
+    """
+    클라이언트의 Accept-Encoding 에 따라 응답 본문을 brotli(br) 또는 gzip 으로 압축하는 ASGI 미들웨어.
+    minimum_size 보다 작거나, 이미 인코딩됐거나, 압축 효과가 없는 형식의 응답은 그대로 보낸다.
+    본문을 여러 번에 나눠 보내는 스트리밍 응답도 압축하지 않고 그대로 흘려보낸다.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        start_message = None
+        streaming = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, streaming
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or streaming:
+                await send(message)
+                return
+
+            if message.get("more_body", False):
+                # 스트리밍 응답: 압축 없이 그대로 전달
+                streaming = True
+                await send(start_message)
+                await send(message)
+                return
+
+            await self._send_body(scope, send, start_message, message.get("body", b""), encoding)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_body(self, scope, send, start_message, body: bytes, encoding: Optional[str]):
+        headers = MutableHeaders(raw=start_message["headers"])
+        endpoint = route_label(scope)
+        content_type = headers.get("content-type", "")
+
+        if (encoding is not None
+                and start_message["status"] not in (204, 304)
+                and len(body) >= self.minimum_size
+                and "content-encoding" not in headers
+                and content_type.startswith(COMPRESSIBLE_TYPES)):
+            compressed = self._compress(body, encoding)
+            if len(compressed) < len(body):
+                metrics.inc("response_bytes_saved_total", len(body) - len(compressed),
+                            endpoint=endpoint, method=encoding)
+                body = compressed
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+
+        metrics.inc("response_body_bytes_total", len(body),
+                    endpoint=endpoint, encoding=headers.get("content-encoding", "identity"))
+
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body})
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
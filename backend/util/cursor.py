@@ -0,0 +1,23 @@
+import base64
+import json
+from typing import Any, List
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값 목록을 URL 에 그대로 쓸 수 있는 불투명한 문자열로 변환"""
+    raw = json.dumps(values, separators=(",", ":"), ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """encode_cursor 로 만든 문자열을 값 목록으로 복원. 형식이 맞지 않으면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+
+    return values
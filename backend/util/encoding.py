@@ -0,0 +1,100 @@
+from datetime import date, datetime, time
+from typing import List, Optional, Tuple
+
+import orjson
+from starlette.responses import Response
+
+from util.metrics import metrics
+
+try:
+    import msgpack
+except ImportError:  # msgpack 이 없으면 columnar JSON 만 지원
+    msgpack = None
+
+COLUMNAR_JSON_TYPE = "application/vnd.surine.columnar+json"
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+
+FORMAT_MEDIA_TYPES = {
+    "json": "application/json",
+    "columnar": COLUMNAR_JSON_TYPE,
+    "msgpack": "application/msgpack",
+}
+
+
+def negotiate_list_format(accept: Optional[str]) -> str:
+    """
+    목록 응답 형식 선택. Accept 에 columnar JSON 이나 MessagePack 이 명시된 경우에만 바꾸고,
+    그 밖에는 (*/* 포함) 기존 JSON 을 그대로 쓴다.
+    """
+    if not accept:
+        return "json"
+
+    for media_range in accept.split(","):
+        media_type = media_range.split(";")[0].strip().lower()
+        if media_type == COLUMNAR_JSON_TYPE:
+            return "columnar"
+        if media_type in MSGPACK_TYPES and msgpack is not None:
+            return "msgpack"
+
+    return "json"
+
+
+def _flatten(row: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in row.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def to_columnar(rows: List[dict]) -> dict:
+    """
+    dict 목록을 필드 이름을 한 번만 담은 {"columns": [...], "rows": [[...], ...]} 로 변환.
+    중첩 dict 는 "place.name" 처럼 점으로 이은 열 이름으로 펼친다.
+    """
+    flat_rows = [_flatten(row) for row in rows]
+    columns = list(flat_rows[0]) if flat_rows else []
+    return {"columns": columns, "rows": [[row.get(column) for column in columns] for row in flat_rows]}
+
+
+def _msgpack_default(value):
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value)}")
+
+
+def encode_payload(payload: dict, fmt: str, list_key: str = "result") -> Tuple[bytes, str, int]:
+    """
+    목록 응답 dict 를 선택한 형식의 bytes 와 media type 으로 직렬화.
+    columnar 는 list_key 의 목록을 열 형식으로 바꾸고, msgpack 은 JSON 과 같은 구조를 MessagePack 으로 담는다.
+    JSON 대비 줄어든 바이트 수도 함께 반환 (본문을 실제로 보낼 때 record_bytes_saved 로 기록).
+    """
+    body = orjson.dumps(payload)
+    if fmt == "json":
+        return body, FORMAT_MEDIA_TYPES["json"], 0
+
+    json_size = len(body)
+    if fmt == "columnar":
+        body = orjson.dumps({**payload, list_key: to_columnar(payload[list_key])})
+    elif fmt == "msgpack":
+        body = msgpack.packb(payload, default=_msgpack_default)
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+
+    # 행이 아주 적으면 열 이름 목록 때문에 오히려 커질 수 있음 (카운터는 줄어들면 안 되므로 0 으로)
+    return body, FORMAT_MEDIA_TYPES[fmt], max(json_size - len(body), 0)
+
+
+def record_bytes_saved(saved: int, fmt: str, endpoint: str):
+    """encode_payload 로 줄인 바이트 수를 response_bytes_saved_total 에 기록 (본문을 보낼 때마다 호출)"""
+    if fmt != "json":
+        metrics.inc("response_bytes_saved_total", saved, endpoint=endpoint, method=fmt)
+
+
+def encoded_response(payload: dict, fmt: str, endpoint: str, list_key: str = "result") -> Response:
+    """encode_payload 결과를 응답으로 만든다. 같은 URL 이 Accept 에 따라 달라지므로 Vary: Accept 를 붙인다."""
+    body, media_type, saved = encode_payload(payload, fmt, list_key=list_key)
+    record_bytes_saved(saved, fmt, endpoint)
+    return Response(content=body, media_type=media_type, headers={"Vary": "Accept"})
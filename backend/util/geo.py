@@ -0,0 +1,130 @@
+import math
+from typing import List, Tuple
+
+# geohash base32 알파벳 (a, i, l, o 제외)
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE_MAP = {c: i for i, c in enumerate(_BASE32)}
+
+# DB에 저장하는 geohash 길이 (약 4.8m x 4.8m 셀)
+GEOHASH_PRECISION = 9
+
+EARTH_RADIUS_M = 6371008.8
+_METERS_PER_DEGREE = 111320.0
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    ch = 0
+    even = True  # 짝수 번째 비트는 경도, 홀수 번째 비트는 위도
+
+    while len(chars) < precision:
+        target, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (target[0] + target[1]) / 2
+        if value >= mid:
+            ch = (ch << 1) | 1
+            target[0] = mid
+        else:
+            ch = ch << 1
+            target[1] = mid
+        even = not even
+
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[ch])
+            bit = 0
+            ch = 0
+
+    return "".join(chars)
+
+
+def decode_geohash(geohash: str) -> Tuple[float, float, float, float]:
+    """geohash 셀의 중심 (lat, lng) 와 셀 크기의 절반 (lat_err, lng_err) 를 반환"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+
+    for c in geohash:
+        value = _DECODE_MAP[c]
+        for shift in range(4, -1, -1):
+            target = lng_range if even else lat_range
+            mid = (target[0] + target[1]) / 2
+            if (value >> shift) & 1:
+                target[0] = mid
+            else:
+                target[1] = mid
+            even = not even
+
+    lat = (lat_range[0] + lat_range[1]) / 2
+    lng = (lng_range[0] + lng_range[1]) / 2
+    return lat, lng, (lat_range[1] - lat_range[0]) / 2, (lng_range[1] - lng_range[0]) / 2
+
+
+def geohash_neighbors(geohash: str) -> List[str]:
+    """자기 자신을 포함한 주변 3x3 셀의 geohash 목록"""
+    lat, lng, lat_err, lng_err = decode_geohash(geohash)
+    precision = len(geohash)
+
+    cells = []
+    for d_lat in (-1, 0, 1):
+        for d_lng in (-1, 0, 1):
+            n_lat = lat + d_lat * lat_err * 2
+            n_lng = lng + d_lng * lng_err * 2
+            if n_lat > 90 or n_lat < -90:
+                continue
+            # 날짜 변경선을 넘어가면 반대편으로 감싼다
+            n_lng = (n_lng + 180) % 360 - 180
+            cell = encode_geohash(n_lat, n_lng, precision)
+            if cell not in cells:
+                cells.append(cell)
+
+    return cells
+
+
+def geohash_cell_size(precision: int, lat: float) -> Tuple[float, float]:
+    """주어진 위도에서 geohash 셀의 (세로, 가로) 크기 (미터)"""
+    bits = precision * 5
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+
+    height = 180.0 / (2 ** lat_bits) * _METERS_PER_DEGREE
+    width = 360.0 / (2 ** lng_bits) * _METERS_PER_DEGREE * math.cos(math.radians(lat))
+    return height, width
+
+
+def precision_for_radius(radius_m: float, lat: float) -> int:
+    """
+    3x3 이웃 셀이 반경 전체를 덮을 수 있는 가장 긴 geohash 길이.
+    셀 한 변이 반경보다 길면 중심 셀 + 이웃 셀 안에 반경 원이 모두 들어간다.
+    0 이면 geohash 로 범위를 좁힐 수 없다는 뜻.
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = geohash_cell_size(precision, lat)
+        if min(height, width) >= radius_m:
+            return precision
+
+    return 0
+
+
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 거리 (미터)"""
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    d_lat = p2 - p1
+    d_lng = math.radians(lng2 - lng1)
+
+    a = math.sin(d_lat / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(d_lng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def lat_lng_to_tile(lat: float, lng: float, zoom: int) -> Tuple[int, int]:
+    """웹 메르카토르 타일 좌표 (x, y) - 지도 SDK 의 줌 레벨과 같은 격자"""
+    n = 2 ** zoom
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    lat_rad = math.radians(lat)
+
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
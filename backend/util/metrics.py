@@ -0,0 +1,121 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# 초 단위 지연 시간용 기본 버킷
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _label_key(labels: dict) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ''
+    pairs = ','.join('{}="{}"'.format(k, v.replace('\\', '\\\\').replace('"', '\\"')) for k, v in key)
+    return '{' + pairs + '}'
+
+
+def _format_value(value: float) -> str:
+    # 바이트 수처럼 큰 정수 카운터가 지수 표기로 잘리지 않게 정수는 그대로 출력
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def route_label(scope: dict) -> str:
+    """ASGI scope 의 라우트 경로 템플릿 (예: /places/{place_id}). 경로 값마다 시계열이 늘어나지 않도록 레이블로 사용."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsRegistry:
+    """프로세스 내 메트릭 저장소. /metrics 에서 Prometheus 텍스트 형식으로 내보낸다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._buckets: Dict[str, Sequence[float]] = {}
+        # 이름 -> 레이블 -> [버킷별 개수..., 합계, 개수]
+        self._histograms: Dict[str, Dict[LabelKey, List[float]]] = {}
+
+    def describe(self, name: str, metric_type: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._help[name] = (metric_type, help_text)
+        if metric_type == 'histogram':
+            self._buckets[name] = tuple(buckets)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def add(self, name: str, value: float, **labels):
+        """게이지 값을 value 만큼 증감 (진행 중인 요청 수 등)"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, **labels):
+        buckets = self._buckets.get(name, DEFAULT_BUCKETS)
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            data = series.get(key)
+            if data is None:
+                data = series[key] = [0] * (len(buckets) + 2)
+            index = bisect_left(buckets, value)
+            if index < len(buckets):
+                data[index] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    def get(self, name: str, **labels) -> float:
+        series = self._counters.get(name) or self._gauges.get(name, {})
+        return series.get(_label_key(labels), 0)
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric_type, help_text = self._help.get(name, ('counter', ''))
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for key, value in series.items():
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+            for name, series in sorted(self._gauges.items()):
+                _, help_text = self._help.get(name, ('gauge', ''))
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} gauge")
+                for key, value in series.items():
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+            for name, series in sorted(self._histograms.items()):
+                _, help_text = self._help.get(name, ('histogram', ''))
+                buckets = self._buckets.get(name, DEFAULT_BUCKETS)
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, data in series.items():
+                    cumulative = 0
+                    for bound, count in zip(buckets, data):
+                        cumulative += count
+                        bucket_key = key + (('le', f"{bound:g}"),)
+                        lines.append(f"{name}_bucket{_format_labels(bucket_key)} {_format_value(cumulative)}")
+                    lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} {_format_value(data[-1])}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(data[-2])}")
+                    lines.append(f"{name}_count{_format_labels(key)} {_format_value(data[-1])}")
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from config import settings
+from util.metrics import metrics
+
+metrics.describe("password_hash_seconds", "histogram", "bcrypt hash/verify time in the worker pool by operation")
+metrics.describe("password_hash_wait_seconds", "histogram", "Time a hash/verify job waited for a free worker")
+metrics.describe("password_hash_rejected_total", "counter", "hash/verify jobs rejected because the queue was full")
+
+
+class PasswordHasherBusy(Exception):
+    """대기 중인 해시 작업이 너무 많아 새 작업을 받지 않을 때"""
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 크기가 정해진 스레드 풀에서 실행한다.
+    bcrypt 는 계산 중 GIL 을 놓기 때문에 스레드로도 병렬 처리되며, 이벤트 루프는 막히지 않는다.
+    실행 중 + 대기 중 작업이 max_workers + max_pending 을 넘으면 PasswordHasherBusy 를 던져
+    요청이 한없이 쌓이지 않게 한다.
+    """
+
+    def __init__(self, rounds: int, max_workers: int, max_pending: int):
+        self.context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        self.max_jobs = max_workers + max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._jobs = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        with self._lock:
+            if self._jobs >= self.max_jobs:
+                metrics.inc("password_hash_rejected_total")
+                raise PasswordHasherBusy()
+            self._jobs += 1
+
+    def _release(self):
+        with self._lock:
+            self._jobs -= 1
+
+    def _timed(self, op: str, fn, *args):
+        submitted_at = time.perf_counter()
+
+        def job():
+            started_at = time.perf_counter()
+            metrics.observe("password_hash_wait_seconds", started_at - submitted_at)
+            try:
+                return fn(*args)
+            finally:
+                metrics.observe("password_hash_seconds", time.perf_counter() - started_at, op=op)
+
+        return job
+
+    async def _run(self, op: str, fn, *args):
+        self._acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._timed(op, fn, *args))
+        finally:
+            self._release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", self.context.verify, password, hashed_password)
+
+
+password_hasher = PasswordHasher(rounds=settings.BCRYPT_ROUNDS,
+                                 max_workers=settings.PASSWORD_HASH_WORKERS,
+                                 max_pending=settings.PASSWORD_HASH_MAX_PENDING)
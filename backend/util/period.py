@@ -0,0 +1,23 @@
+from datetime import date, time, timedelta
+
+# 수영 통계 집계 단위
+PERIODS = ("week", "month", "year")
+
+
+def period_start(day: date, period: str) -> date:
+    """날짜가 속한 집계 구간의 첫날 (주는 월요일 시작)"""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    if period == "year":
+        return day.replace(month=1, day=1)
+    raise ValueError(f"Unknown period: {period}")
+
+
+def duration_seconds(start: time, end: time) -> int:
+    """시작/종료 시각 사이의 초. 종료가 시작보다 이르면 자정을 넘긴 것으로 본다."""
+    seconds = (end.hour * 3600 + end.minute * 60 + end.second) - (start.hour * 3600 + start.minute * 60 + start.second)
+    if seconds < 0:
+        seconds += 24 * 3600
+    return seconds
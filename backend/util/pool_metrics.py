@@ -0,0 +1,82 @@
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+from util.metrics import metrics
+
+# 커넥션 풀 대기는 대부분 1ms 미만이므로 지연 시간 기본 버킷보다 잘게
+CHECKOUT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+metrics.describe("db_pool_checkout_seconds", "histogram",
+                 "Time to get a connection from the pool by engine, including waits and pre-ping",
+                 buckets=CHECKOUT_BUCKETS)
+metrics.describe("db_pool_checkout_errors_total", "counter",
+                 "Failed pool checkouts by engine and reason (timeout: pool exhausted, connect: DB connection failed)")
+metrics.describe("db_pool_connections_created_total", "counter", "New DB connections opened by engine")
+metrics.describe("db_pool_invalidated_total", "counter",
+                 "Pooled connections discarded by engine (failed pre-ping, disconnects)")
+metrics.describe("db_pool_checked_out", "gauge", "Connections currently checked out by engine")
+metrics.describe("db_pool_capacity", "gauge", "Maximum connections (pool size + max overflow) by engine")
+metrics.describe("db_pool_saturation", "gauge", "Checked out connections / capacity by engine")
+
+
+class _MeteredPoolMixin:
+    metrics_label = ""
+
+    @classmethod
+    def labelled(cls, label: str):
+        """metrics_label 만 다른 하위 클래스 (복제본처럼 같은 종류의 엔진이 여러 개일 때 엔진별로 구분)"""
+        return type(f"{cls.__name__}_{label}", (cls,), {"metrics_label": label})
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            metrics.inc("db_pool_checkout_errors_total", engine=self.metrics_label, reason="timeout")
+            raise
+        except Exception:
+            metrics.inc("db_pool_checkout_errors_total", engine=self.metrics_label, reason="connect")
+            raise
+        finally:
+            metrics.observe("db_pool_checkout_seconds", time.perf_counter() - started_at, engine=self.metrics_label)
+        return connection
+
+
+class MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    """체크아웃 대기 시간과 실패를 기록하는 QueuePool (동기 엔진용)"""
+    metrics_label = "sync"
+
+
+class MeteredAsyncQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간과 실패를 기록하는 AsyncAdaptedQueuePool (비동기 엔진용)"""
+    metrics_label = "async"
+
+
+def instrument_pool(engine: Engine, label: str, capacity: int):
+    """풀 이벤트로 사용 중인 연결 수/포화도와 새 연결, 폐기된 연결 수를 기록 (비동기 엔진은 engine.sync_engine)"""
+    metrics.set("db_pool_capacity", capacity, engine=label)
+
+    def set_usage(checked_out: int):
+        metrics.set("db_pool_checked_out", checked_out, engine=label)
+        metrics.set("db_pool_saturation", round(checked_out / capacity, 4) if capacity else 0, engine=label)
+
+    def on_checkout(*_):
+        set_usage(engine.pool.checkedout())
+
+    def on_checkin(*_):
+        # checkin 이벤트는 풀에 반납되기 전에 호출되므로 반납할 연결을 빼고 계산
+        set_usage(max(engine.pool.checkedout() - 1, 0))
+
+    def on_connect(*_):
+        metrics.inc("db_pool_connections_created_total", engine=label)
+
+    def on_invalidate(*_):
+        metrics.inc("db_pool_invalidated_total", engine=label)
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "invalidate", on_invalidate)
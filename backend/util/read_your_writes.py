@@ -0,0 +1,42 @@
+import math
+import time
+from typing import Optional
+
+from config import settings
+
+# 마지막 쓰기 표시를 담는 쿠키/헤더. 값은 "유저id.밀리초타임스탬프"
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+
+def mark_last_write(response, user_id: int):
+    """
+    쓰기를 커밋한 응답에 마지막 쓰기 시각을 쿠키와 헤더로 붙인다.
+    서버 프로세스가 여러 개여도 클라이언트가 다음 요청에 그대로 돌려보내므로 어느 프로세스든 읽기를 primary 로 보낼 수 있다.
+    (쿠키를 쓰지 않는 앱은 응답의 X-Last-Write 값을 다음 요청의 같은 헤더로 보낸다)
+    """
+    marker = f"{user_id}.{int(time.time() * 1000)}"
+    response.headers[LAST_WRITE_HEADER] = marker
+    response.set_cookie(LAST_WRITE_COOKIE, marker, httponly=True, samesite="lax",
+                        max_age=max(1, math.ceil(settings.DATABASE_READ_YOUR_WRITES_SECONDS)))
+
+
+def is_recent_writer(request, user_id: Optional[int]) -> bool:
+    """요청에 실린 마지막 쓰기 표시가 이 유저의 것이고 DATABASE_READ_YOUR_WRITES_SECONDS 안이면 True"""
+    if user_id is None:
+        return False
+
+    marker = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(LAST_WRITE_COOKIE)
+    if not marker:
+        return False
+
+    marker_user_id, _, written_at = marker.partition(".")
+    try:
+        if int(marker_user_id) != user_id:
+            return False
+        elapsed = time.time() - int(written_at) / 1000
+    except ValueError:
+        return False
+
+    # 서버 간 시계 차이를 고려해 약간의 미래 값은 허용
+    return -1 <= elapsed <= settings.DATABASE_READ_YOUR_WRITES_SECONDS
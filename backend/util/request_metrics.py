@@ -0,0 +1,98 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from util.metrics import metrics, route_label
+
+# SQL 실행 횟수용 버킷 (한 요청의 쿼리 수가 목록 크기만큼 늘어나면 N+1 을 의심)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+metrics.describe("http_requests_total", "counter", "HTTP requests by method, route and status code")
+metrics.describe("http_requests_in_progress", "gauge", "HTTP requests currently being handled by method")
+metrics.describe("http_request_duration_seconds", "histogram", "HTTP request latency by method and route")
+metrics.describe("http_request_db_queries", "histogram", "SQL statements executed per request by method and route",
+                 buckets=QUERY_COUNT_BUCKETS)
+metrics.describe("http_request_db_seconds", "histogram", "Total SQL execution time per request by method and route")
+
+
+class RequestStats:
+    __slots__ = ("query_count", "db_seconds")
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_seconds = 0.0
+
+
+# 현재 요청의 SQL 통계. 스레드풀(동기 라우터)과 run_sync(비동기 라우터)로 컨텍스트가 복사되어도
+# 같은 객체를 가리키므로 어디서 실행된 쿼리든 요청 단위로 합산된다.
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.query_count += 1
+        stats.db_seconds += time.perf_counter() - started_at
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine):
+    """엔진의 cursor 실행 이벤트로 요청별 SQL 횟수/시간을 수집 (비동기 엔진은 engine.sync_engine 을 넘긴다)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class RequestMetricsMiddleware:
+    """
+    요청마다 라우트별 지연 시간, 상태 코드, 진행 중인 요청 수와 SQL 실행 횟수/시간을 기록하는 ASGI 미들웨어.
+    라우트 레이블은 경로 템플릿(예: /places/{place_id}) 이라 경로 값마다 시계열이 늘어나지 않는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.add("http_requests_in_progress", 1, method=method)
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            _request_stats.reset(token)
+            metrics.add("http_requests_in_progress", -1, method=method)
+
+            route = route_label(scope)
+            metrics.inc("http_requests_total", method=method, route=route, status=status_code)
+            metrics.observe("http_request_duration_seconds", elapsed, method=method, route=route)
+            metrics.observe("http_request_db_queries", stats.query_count, method=method, route=route)
+            metrics.observe("http_request_db_seconds", stats.db_seconds, method=method, route=route)
@@ -0,0 +1,55 @@
+import hashlib
+import time
+from typing import Hashable, Optional, Tuple
+
+from util.cache import TTLCache
+
+
+class ResponseCache:
+    """
+    직렬화한 JSON 응답 본문(bytes)과 ETag 캐시.
+    generation 은 데이터 버전(data_version)으로, 적재 스크립트가 버전을 올리면 확인 주기 안에 캐시를 통째로 비운다.
+    ETag 에 generation 이 들어가므로 데이터가 바뀌면 클라이언트가 가진 ETag 도 더 이상 맞지 않는다.
+    bytes_saved 는 columnar/msgpack 본문이 JSON 대비 줄인 바이트 수로, 캐시에서 꺼내 보낼 때도 기록하려고 함께 둔다.
+    """
+
+    def __init__(self, maxsize: int = 2000, ttl: float = 600.0, check_interval: float = 30.0):
+        self.check_interval = check_interval
+        self.generation: Optional[int] = None
+        self._checked_at = 0.0
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def needs_check(self) -> bool:
+        return self.generation is None or time.monotonic() - self._checked_at >= self.check_interval
+
+    def set_generation(self, generation: int):
+        if generation != self.generation:
+            self._cache.clear()
+            self.generation = generation
+        self._checked_at = time.monotonic()
+
+    def get(self, key: Hashable) -> Optional[Tuple[bytes, str, int]]:
+        return self._cache.get((self.generation, key))
+
+    def set(self, key: Hashable, body: bytes, bytes_saved: int = 0) -> Tuple[bytes, str, int]:
+        etag = make_etag(body, self.generation)
+        self._cache.set((self.generation, key), (body, etag, bytes_saved))
+        return body, etag, bytes_saved
+
+
+def make_etag(body: bytes, generation: Optional[int] = None) -> str:
+    digest = hashlib.sha1(body).hexdigest()[:20]
+    return f'"{generation}-{digest}"' if generation is not None else f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 목록, W/ 약한 비교, *)가 etag 와 맞는지"""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+
+    return False
@@ -0,0 +1,33 @@
+import re
+import unicodedata
+from typing import Set
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 검색 인덱스에 저장하는 n-gram 길이 (한글은 2글자 단위가 검색 품질/인덱스 크기 균형이 좋다)
+NGRAM_SIZE = 2
+
+# MySQL 과 SQLite 모두에서 따옴표 이스케이프 문제가 없는 LIKE escape 문자
+LIKE_ESCAPE = '/'
+
+
+def normalize_text(text: str) -> str:
+    """
+    검색용 정규화: NFKC (전각 문자, 호환 자모 정리) + 소문자 + 공백 제거.
+    '올림픽 수영장' 과 '올림픽수영장' 이 같은 문자열로 취급된다.
+    """
+    if not text:
+        return ''
+
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _WHITESPACE.sub('', text)
+
+
+def ngrams(text: str) -> Set[str]:
+    """정규화된 문자열의 n-gram 집합 (인덱스 저장용)"""
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def escape_like(text: str) -> str:
+    """LIKE 패턴에서 와일드카드로 해석되지 않도록 이스케이프"""
+    return text.replace('/', '//').replace('%', '/%').replace('_', '/_')
@@ -0,0 +1,108 @@
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from util.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+metrics.describe("slow_queries_total", "counter", "SQL statements slower than SLOW_QUERY_THRESHOLD_MS by calling crud function")
+
+# 호출한 crud 함수를 찾을 때 보는 파일 (crud/crud.py)
+_CRUD_FILE = os.path.join("crud", "crud.py")
+# 로그에 남기는 파라미터 표현의 최대 길이 (대량 INSERT 의 파라미터가 버퍼를 다 차지하지 않게)
+_MAX_PARAMS_LENGTH = 500
+
+
+def find_crud_caller() -> Optional[str]:
+    """호출 스택에서 가장 가까운 crud/crud.py 함수를 "함수명:줄번호" 로 반환 (없으면 None)"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        # <listcomp>, <lambda> 등은 건너뛰고 감싸는 함수를 사용
+        if frame.f_code.co_filename.endswith(_CRUD_FILE) and not frame.f_code.co_name.startswith("<"):
+            return f"{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """
+    threshold_ms 보다 오래 걸린 SQL 의 문장, 파라미터, 소요 시간, 호출한 crud 함수를 최근 maxlen 개만 보관하는 링 버퍼.
+    explain_sample_rate 비율로 느린 SELECT 의 실행 계획(EXPLAIN)을 같은 연결에서 다시 조회해 함께 저장한다.
+    threshold_ms 가 0 이하면 기록하지 않는다.
+    """
+
+    def __init__(self, threshold_ms: float = 200, explain_sample_rate: float = 0.0, maxlen: int = 100):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._entries = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def instrument(self, engine: Engine):
+        """엔진의 cursor 실행 이벤트에 연결 (비동기 엔진은 engine.sync_engine 을 넘긴다)"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def entries(self, limit: Optional[int] = None) -> List[dict]:
+        # 최근 항목부터
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit is not None else entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started_at", []).append(time.perf_counter())
+
+    def _handle_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("slow_query_started_at"):
+            conn.info["slow_query_started_at"].pop()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info["slow_query_started_at"].pop()) * 1000
+        if self.threshold_ms <= 0 or duration_ms < self.threshold_ms:
+            return
+
+        caller = find_crud_caller()
+        metrics.inc("slow_queries_total", caller=(caller or "other").split(":")[0])
+        logger.warning("slow query %.1fms (%s): %s", duration_ms, caller or "-", " ".join(statement.split()))
+
+        entry = {
+            "logged_at": datetime.now(),
+            "duration_ms": round(duration_ms, 2),
+            "caller": caller,
+            "statement": statement,
+            "parameters": repr(parameters)[:_MAX_PARAMS_LENGTH],
+            "explain": None,
+        }
+        if (not executemany and statement.lstrip()[:6].upper() == "SELECT"
+                and random.random() < self.explain_sample_rate):
+            entry["explain"] = self._explain(conn, statement, parameters)
+
+        with self._lock:
+            self._entries.append(entry)
+
+    def _explain(self, conn, statement: str, parameters) -> List[str]:
+        # 결과를 아직 읽지 않았을 수 있는 원래 cursor 대신 새 DBAPI cursor 로 실행
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return [" | ".join(str(value) for value in row) for row in cursor.fetchall()]
+        except Exception as e:
+            return [f"EXPLAIN failed: {e}"]
+        finally:
+            cursor.close()
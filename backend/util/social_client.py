@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+from typing import Optional
+
+import httpx
+
+from config import settings
+from util.cache import TTLCache
+from util.metrics import metrics
+
+metrics.describe("social_profile_requests_total", "counter",
+                 "Social login profile lookups by provider and result (cache, ok, invalid, error)")
+metrics.describe("social_profile_request_seconds", "histogram", "Profile API latency by provider, including retries")
+
+
+class SocialProfileError(Exception):
+    """
+    소셜 로그인 프로필 조회 실패.
+    invalid_token 이 True 면 제공자가 토큰을 거부한 것이고, False 면 네트워크/제공자 장애다.
+    """
+
+    def __init__(self, provider: str, invalid_token: bool, detail: str = ''):
+        super().__init__(detail)
+        self.provider = provider
+        self.invalid_token = invalid_token
+        self.detail = detail
+
+
+class SocialProfileClient:
+    """
+    카카오/네이버/구글 프로필 조회용 공용 비동기 HTTP 클라이언트.
+    - 커넥션 풀과 keep-alive 를 공유하고, 타임아웃과 재시도(연결 오류, 5xx)를 적용한다.
+    - 같은 토큰으로 다시 로그인하면 토큰 해시를 키로 한 짧은 캐시에서 프로필을 돌려준다.
+    제공자 URL 은 settings 에서 바꿀 수 있어 로컬 스텁 서버로 테스트할 수 있다.
+    """
+
+    def __init__(self):
+        self.profile_urls = {
+            "kakao": settings.KAKAO_PROFILE_URL,
+            "naver": settings.NAVER_PROFILE_URL,
+            "google": settings.GOOGLE_PROFILE_URL,
+        }
+        self.retries = settings.SOCIAL_HTTP_RETRIES
+        self._cache = TTLCache(maxsize=10000, ttl=settings.SOCIAL_PROFILE_CACHE_TTL)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.SOCIAL_HTTP_TIMEOUT, connect=settings.SOCIAL_HTTP_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=settings.SOCIAL_HTTP_MAX_CONNECTIONS,
+                                    max_keepalive_connections=settings.SOCIAL_HTTP_MAX_CONNECTIONS,
+                                    keepalive_expiry=30),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_profile(self, provider: str, access_token: str) -> dict:
+        cache_key = (provider, hashlib.sha256(access_token.encode("utf-8")).hexdigest())
+        profile = self._cache.get(cache_key)
+        if profile is not None:
+            metrics.inc("social_profile_requests_total", provider=provider, result="cache")
+            return profile
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        try:
+            profile = await self._request(provider, access_token)
+        except SocialProfileError as e:
+            metrics.inc("social_profile_requests_total", provider=provider,
+                        result="invalid" if e.invalid_token else "error")
+            raise
+        finally:
+            metrics.observe("social_profile_request_seconds", loop.time() - started_at, provider=provider)
+
+        metrics.inc("social_profile_requests_total", provider=provider, result="ok")
+        self._cache.set(cache_key, profile)
+        return profile
+
+    async def _request(self, provider: str, access_token: str) -> dict:
+        client = self._get_client()
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        last_error = ''
+        for attempt in range(self.retries + 1):
+            if attempt:
+                # 0.1초, 0.2초, 0.4초 ... 로 간격을 늘려 재시도
+                await asyncio.sleep(0.1 * 2 ** (attempt - 1))
+
+            try:
+                res = await client.get(self.profile_urls[provider], headers=headers)
+            except httpx.TransportError as e:
+                last_error = f"{type(e).__name__}: {e}"
+                continue
+
+            if res.status_code >= 500:
+                last_error = f"HTTP {res.status_code}"
+                continue
+
+            if res.status_code != 200:
+                raise SocialProfileError(provider, invalid_token=True, detail=f"HTTP {res.status_code}")
+
+            try:
+                return res.json()
+            except ValueError:
+                raise SocialProfileError(provider, invalid_token=False, detail="Invalid JSON response")
+
+        raise SocialProfileError(provider, invalid_token=False, detail=last_error)
+
+
+social_profile_client = SocialProfileClient()
@@ -0,0 +1,123 @@
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from typing import Iterable, List, Tuple
+
+from config import settings
+from util.search import normalize_text
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNGSEONG_JONGSEONG_COUNT = 588  # 21 * 28
+# NFKC 정규화하면 호환 자모 'ㄱ'~'ㅎ' 가 초성 자모 U+1100~U+1112 로 바뀌므로 같은 범위를 쓴다
+_CHOSEONG_BASE = 0x1100
+_CHOSEONG_LAST = 0x1112
+
+
+def chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꾼 문자열 (한글이 아닌 문자는 그대로 둔다)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(chr(_CHOSEONG_BASE + (code - _HANGUL_BASE) // _JUNGSEONG_JONGSEONG_COUNT))
+        else:
+            chars.append(ch)
+    return ''.join(chars)
+
+
+def is_chosung_query(text: str) -> bool:
+    return bool(text) and all(_CHOSEONG_BASE <= ord(ch) <= _CHOSEONG_LAST for ch in text)
+
+
+class PlaceSuggestIndex:
+    """
+    장소 이름 자동완성용 인메모리 정렬 배열 인덱스.
+    - 이름을 자모 단위(NFD)로 분해해 저장하므로 '수여' 처럼 음절 입력 중인 검색어도 '수영장' 에 걸린다.
+    - 초성만 입력하면 (예: 'ㅇㄹㅍ') 초성 배열에서 찾는다.
+    - 이름 전체의 접두사 외에 띄어쓰기 단위 단어의 접두사로도 찾는다.
+    데이터가 바뀌면 data_version 의 'place' 버전이 올라가고, crud.ensure_place_suggest_index 가 다시 만든다.
+    """
+
+    def __init__(self, check_interval: float = 30.0):
+        self.check_interval = check_interval
+        self.version = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+        # (names, keys, word_keys, chosung_keys, chosung_word_keys). build 가 통째로 바꾸고 search 는 한 번만 읽는다
+        self._snapshot: Tuple[List[Tuple[int, str]], List[Tuple[str, int]], List[Tuple[str, int]],
+                              List[Tuple[str, int]], List[Tuple[str, int]]] = ([], [], [], [], [])
+
+    def needs_check(self) -> bool:
+        return self.version is None or time.monotonic() - self.checked_at >= self.check_interval
+
+    def mark_checked(self):
+        self.checked_at = time.monotonic()
+
+    def build(self, entries: Iterable[Tuple[int, str]], version: int):
+        names = []
+        keys, word_keys = [], []
+        chosung_keys, chosung_word_keys = [], []
+
+        for place_id, name in entries:
+            idx = len(names)
+            names.append((place_id, name))
+
+            words = [normalize_text(word) for word in name.split()]
+            words = [word for word in words if word]
+            full = ''.join(words)
+            if not full:
+                continue
+
+            keys.append((unicodedata.normalize("NFD", full), idx))
+            chosung_keys.append((chosung(full), idx))
+
+            # 두 번째 단어부터는 해당 단어로 시작하는 나머지 문자열을 키로 추가
+            for i in range(1, len(words)):
+                rest = ''.join(words[i:])
+                word_keys.append((unicodedata.normalize("NFD", rest), idx))
+                chosung_word_keys.append((chosung(rest), idx))
+
+        keys.sort()
+        word_keys.sort()
+        chosung_keys.sort()
+        chosung_word_keys.sort()
+
+        # 한 번의 대입으로 바꿔서 검색 중인 요청이 새 이름 목록과 옛 키 배열을 섞어 보지 않게 한다
+        self._snapshot = (names, keys, word_keys, chosung_keys, chosung_word_keys)
+        self.version = version
+        self.mark_checked()
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        query = normalize_text(query)
+        if not query:
+            return []
+
+        names, keys, word_keys, chosung_keys, chosung_word_keys = self._snapshot
+        if is_chosung_query(query):
+            arrays = (chosung_keys, chosung_word_keys)
+        else:
+            query = unicodedata.normalize("NFD", query)
+            arrays = (keys, word_keys)
+
+        seen = set()
+        result = []
+        # 이름 전체 접두사 일치를 먼저, 단어 접두사 일치를 나중에 채운다
+        for array in arrays:
+            i = bisect_left(array, (query, -1))
+            while i < len(array) and len(result) < limit:
+                key, idx = array[i]
+                if not key.startswith(query):
+                    break
+                if idx not in seen:
+                    seen.add(idx)
+                    place_id, name = names[idx]
+                    result.append({"id": place_id, "name": name})
+                i += 1
+
+        return result
+
+
+place_suggest_index = PlaceSuggestIndex(check_interval=settings.PLACE_VERSION_CHECK_INTERVAL)